@@ -12,6 +12,7 @@ from typing import Optional, Dict
 #load dotenv
 from dotenv import load_dotenv
 from .config import settings
+from .utils import get_http_session
 
 load_dotenv()
 
@@ -55,7 +56,7 @@ def extract_jwt_token() -> Optional[str]:
     }
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = get_http_session().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         html_content = response.text
 
@@ -3,11 +3,14 @@ Centralized Configuration Manager.
 Loads environment variables once and allows runtime updates.
 """
 import os
+import logging
 from dotenv import load_dotenv, set_key
 
 # Load .env file immediately
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 class Settings:
     _instance = None
 
@@ -41,11 +44,11 @@ class Settings:
         try:
             if os.path.exists(self.ENV_FILE_PATH):
                 set_key(self.ENV_FILE_PATH, "TRADINGVIEW_COOKIE", new_cookie_string)
-                print(f"✅ Updated .env file locally.")
+                logger.info("✅ Updated .env file locally.")
             else:
-                print("⚠️ .env file not found, skipping persistence.")
+                logger.info("⚠️ .env file not found, skipping persistence.")
         except Exception as e:
-            print(f"⚠️ Could not write to .env (expected on Vercel/ReadOnly): {e}")
+            logger.warning("⚠️ Could not write to .env (expected on Vercel/ReadOnly): %s", e)
 
 # Global instance
 settings = Settings()
\ No newline at end of file
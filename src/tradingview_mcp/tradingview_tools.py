@@ -14,6 +14,8 @@ import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import contextlib
 import io
+import sys
+import orjson
 
 from .validators import (
     validate_exchange, validate_timeframe, validate_news_provider,
@@ -22,7 +24,7 @@ from .validators import (
 )
 from .utils import (
     merge_ohlc_with_indicators, clean_for_json,
-    extract_news_body
+    extract_news_body, get_http_session
 )
 from .auth import extract_jwt_token, get_token_info
 from .config import settings
@@ -38,6 +40,32 @@ _token_cache = {
 }
 _token_lock = threading.Lock()
 
+# redirect_stdout swaps the process-wide sys.stdout, so overlapping uses from
+# worker threads would restore each other's buffers. Concurrent scraper calls
+# share one redirect; the real stdout comes back when the last one finishes.
+_quiet_lock = threading.Lock()
+_quiet_depth = 0
+_quiet_saved_stdout = None
+
+
+@contextlib.contextmanager
+def _quiet_stdout():
+    """Discard print() output from a scraper call. Safe to enter from several threads at once."""
+    global _quiet_depth, _quiet_saved_stdout
+    with _quiet_lock:
+        if _quiet_depth == 0:
+            _quiet_saved_stdout = sys.stdout
+            sys.stdout = io.StringIO()
+        _quiet_depth += 1
+    try:
+        yield
+    finally:
+        with _quiet_lock:
+            _quiet_depth -= 1
+            if _quiet_depth == 0:
+                sys.stdout = _quiet_saved_stdout
+                _quiet_saved_stdout = None
+
 
 def get_valid_jwt_token(force_refresh: bool = False) -> str:
     """
@@ -361,18 +389,24 @@ def fetch_news_headlines(
 
 def fetch_news_content(story_paths: List[str], cookie: Optional[str] = None) -> List[Dict[str, Any]]:
     story_paths = validate_story_paths(story_paths)
-    
-    news_scraper = NewsScraper(
-        export_result=False, 
-        export_type='json',
-        cookie=cookie or settings.TRADINGVIEW_COOKIE
-    )
-    news_content = []
-
-    for story_path in story_paths:
+    cookie = cookie or settings.TRADINGVIEW_COOKIE
+
+    # NewsScraper is not documented as thread-safe, so each worker thread
+    # builds its own and reuses it for the paths it handles
+    scrapers = threading.local()
+
+    def fetch_one(story_path: str) -> Dict[str, Any]:
+        """Fetch and clean a single article; failures are reported per path."""
         try:
             # Capture stdout to prevent print statements from corrupting JSON
-            with contextlib.redirect_stdout(io.StringIO()):
+            with _quiet_stdout():
+                news_scraper = getattr(scrapers, "news_scraper", None)
+                if news_scraper is None:
+                    news_scraper = scrapers.news_scraper = NewsScraper(
+                        export_result=False,
+                        export_type='json',
+                        cookie=cookie
+                    )
                 content = news_scraper.scrape_news_content(story_path=story_path)
 
             # Clean content for JSON serialization
@@ -381,21 +415,26 @@ def fetch_news_content(story_paths: List[str], cookie: Optional[str] = None) ->
             # Extract text body
             body = extract_news_body(cleaned_content)
 
-            news_content.append({
+            return {
                 "success": True,
                 "title": cleaned_content.get("title", ""),
                 "body": body,
                 "story_path": story_path
-            })
+            }
 
         except Exception as e:
-            news_content.append({
+            return {
                 "success": False,
                 "title": "",
                 "body": "",
                 "story_path": story_path,
                 "error": f"Failed to fetch content: {str(e)}"
-            })
+            }
+
+    # Articles are independent GETs, so fetch them in parallel. map() keeps
+    # the input order.
+    with ThreadPoolExecutor(max_workers=min(10, len(story_paths))) as executor:
+        news_content = list(executor.map(fetch_one, story_paths))
 
     return news_content
 
@@ -580,7 +619,6 @@ def fetch_option_chain_data(
     exchange: str,
     expiry_date: Optional[int] = None
 ) -> Dict[str, Any]:
-    import requests
     from http.cookies import SimpleCookie
 
     cookies_str = settings.TRADINGVIEW_COOKIE
@@ -633,11 +671,11 @@ def fetch_option_chain_data(
             'Connection': 'keep-alive'
         }
 
-        response = requests.post(url, json=payload, headers=headers, cookies=cookies, timeout=30)
+        response = get_http_session().post(url, json=payload, headers=headers, cookies=cookies, timeout=30)
         response.raise_for_status()
 
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
         except ValueError as e:
             return {
                 'success': False,
@@ -677,7 +715,6 @@ def get_current_spot_price(symbol: str, exchange: str) -> Dict[str, Any]:
     Returns:
         Dictionary with spot price and pricescale
     """
-    import requests
     from http.cookies import SimpleCookie
 
     cookies_str = settings.TRADINGVIEW_COOKIE
@@ -707,11 +744,11 @@ def get_current_spot_price(symbol: str, exchange: str) -> Dict[str, Any]:
             'User-Agent': 'Mozilla/5.0'
         }
 
-        response = requests.post(url, json=payload, headers=headers, cookies=cookies, timeout=30)
+        response = get_http_session().post(url, json=payload, headers=headers, cookies=cookies, timeout=30)
         response.raise_for_status()
 
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
         except ValueError as e:
             return {
                 'success': False,
@@ -3,12 +3,63 @@ Utility functions for TradingView MCP server.
 """
 
 from datetime import datetime
+from http.cookiejar import DefaultCookiePolicy
+import threading
 import pytz
-from typing import Any, Dict, List
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, List, Optional
 from bs4 import Tag, NavigableString
 from .validators import INDICATOR_MAPPING, INDICATOR_FIELD_MAPPING
 
 
+# Process-wide HTTP session, created on first use
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+# Resolved once; pytz.timezone() does a lookup on every call
+_IST = pytz.timezone('Asia/Kolkata')
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get the shared requests session used for direct TradingView HTTP calls.
+    
+    Reusing one session keeps TCP/TLS connections to TradingView hosts alive
+    across calls instead of paying a new handshake per request. The session
+    never stores cookies from responses, so callers must pass cookies
+    explicitly on every request.
+    
+    Returns:
+        Shared requests.Session instance
+    """
+    global _http_session
+    
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            # Don't let Set-Cookie from one caller leak into the next request
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+            _http_session = session
+        return _http_session
+
+
+def close_http_session() -> None:
+    """
+    Close the shared requests session, if one was created.
+    
+    Releases its pooled connections; the next get_http_session() call
+    builds a fresh session.
+    """
+    global _http_session
+    
+    with _http_session_lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
+
+
 def convert_timestamp_to_indian_time(timestamp: float) -> str:
     """
     Convert Unix timestamp to Indian date/time in 12-hour format.
@@ -23,8 +74,7 @@ def convert_timestamp_to_indian_time(timestamp: float) -> str:
     utc_dt = datetime.fromtimestamp(timestamp, tz=pytz.UTC)
     
     # Convert to Indian Standard Time (IST)
-    ist = pytz.timezone('Asia/Kolkata')
-    indian_dt = utc_dt.astimezone(ist)
+    indian_dt = utc_dt.astimezone(_IST)
     
     # Format in 12-hour format with AM/PM
     formatted_time = indian_dt.strftime("%d-%m-%Y %I:%M:%S %p IST")
@@ -51,6 +101,20 @@ def clean_for_json(obj: Any) -> Any:
         return obj
 
 
+def _ohlc_entry(ohlc_entry: Dict) -> Dict:
+    """Build the base merged record (OHLC fields plus IST datetime) for one candle."""
+    get = ohlc_entry.get
+    return {
+        "open": get('open'),
+        "high": get('high'),
+        "low": get('low'),
+        "close": get('close'),
+        "volume": get('volume'),
+        "index": get('index'),
+        "datetime_ist": convert_timestamp_to_indian_time(get('timestamp'))
+    }
+
+
 def merge_ohlc_with_indicators(data: Dict) -> List[Dict]:
     """
     Merge OHLC data with multiple technical indicators by matching timestamps.
@@ -80,28 +144,12 @@ def merge_ohlc_with_indicators(data: Dict) -> List[Dict]:
     available_indicators = {}
     for indicator_short, (indicator_key, _) in INDICATOR_MAPPING.items():
         # If indicator present under the tradingview key, take its array
-        for indicator_name, indicator_values in indicator_data.items():
-            if indicator_key == indicator_name:
-                # Ensure we copy the list to avoid mutating caller data
-                available_indicators[indicator_short] = list(indicator_values)
-                break
+        if indicator_key in indicator_data:
+            available_indicators[indicator_short] = indicator_data[indicator_key]
     
     if not available_indicators:
         # Return OHLC data without indicators if none found
-        merged_data = []
-        for ohlc_entry in ohlc_data:
-            datetime_ist = convert_timestamp_to_indian_time(ohlc_entry.get('timestamp'))
-            merged_entry = {
-                "open": ohlc_entry.get('open'),
-                "high": ohlc_entry.get('high'),
-                "low": ohlc_entry.get('low'),
-                "close": ohlc_entry.get('close'),
-                "volume": ohlc_entry.get('volume'),
-                "index": ohlc_entry.get('index'),
-                "datetime_ist": datetime_ist
-            }
-            merged_data.append(merged_entry)
-        return merged_data
+        return [_ohlc_entry(ohlc_entry) for ohlc_entry in ohlc_data]
     
     # We'll match indicator entries to OHLC candles by timestamp. Since
     # indicators may come from multiple requests and may include one extra
@@ -110,42 +158,30 @@ def merge_ohlc_with_indicators(data: Dict) -> List[Dict]:
     # (returned via a special _errors key inside merged entries list metadata
     # if needed by callers).
 
-    # Build a mapping from ohlc timestamp -> index in ohlc_data
-    ohlc_index_by_ts = {entry.get('timestamp'): idx for idx, entry in enumerate(ohlc_data)}
-
-    # Prepare per-indicator maps: indicator_short -> {timestamp: entry}
-    indicator_maps = {}
+    # Prepare per-indicator lookups: (indicator_short, {timestamp: entry}, field items).
+    # Field mappings are resolved here once rather than for every candle.
+    indicator_maps = []
     for indicator_short, indicator_values in available_indicators.items():
         ts_map = {}
         for item in indicator_values:
             ts = item.get('timestamp')
             if ts is not None:
                 # If duplicate timestamps exist, prefer the earliest occurrence
-                if ts not in ts_map:
-                    ts_map[ts] = item
-        indicator_maps[indicator_short] = ts_map
+                ts_map.setdefault(ts, item)
+        field_items = tuple(INDICATOR_FIELD_MAPPING.get(indicator_short, {}).items())
+        indicator_maps.append((indicator_short, ts_map, field_items))
 
     merged_data = []
     errors = []
 
     for i, ohlc_entry in enumerate(ohlc_data):
         ohlc_timestamp = ohlc_entry.get('timestamp')
-        datetime_ist = convert_timestamp_to_indian_time(ohlc_timestamp)
-
-        merged_entry = {
-            "open": ohlc_entry.get('open'),
-            "high": ohlc_entry.get('high'),
-            "low": ohlc_entry.get('low'),
-            "close": ohlc_entry.get('close'),
-            "volume": ohlc_entry.get('volume'),
-            "index": ohlc_entry.get('index'),
-            "datetime_ist": datetime_ist
-        }
+        merged_entry = _ohlc_entry(ohlc_entry)
 
         # For each indicator, look up by timestamp; if not present, try to
         # find by close nearby offsets (1 or 2 positions) — BUT do not raise
         # errors. Instead record a warning and continue.
-        for indicator_short, ts_map in indicator_maps.items():
+        for indicator_short, ts_map, field_items in indicator_maps:
             indicator_entry = ts_map.get(ohlc_timestamp)
 
             if indicator_entry is None:
@@ -157,10 +193,8 @@ def merge_ohlc_with_indicators(data: Dict) -> List[Dict]:
                 )
                 continue
 
-            field_mapping = INDICATOR_FIELD_MAPPING.get(indicator_short, {})
-            for index_key, field_name in field_mapping.items():
-                value = indicator_entry.get(index_key, 0)
-                merged_entry[field_name] = value
+            for index_key, field_name in field_items:
+                merged_entry[field_name] = indicator_entry.get(index_key, 0)
 
         merged_data.append(merged_entry)
 
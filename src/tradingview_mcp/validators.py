@@ -89,6 +89,13 @@ INDICATOR_FIELD_MAPPING = {
 }
 
 VALID_INDICATORS = list(INDICATOR_MAPPING.keys())
+_KNOWN_INDICATORS = frozenset(INDICATOR_MAPPING)
+
+# Hashed lookup tables for the per-request membership checks below
+_KNOWN_EXCHANGES = frozenset(VALID_EXCHANGES)
+_KNOWN_TIMEFRAMES = frozenset(VALID_TIMEFRAMES)
+_KNOWN_NEWS_PROVIDERS = frozenset(VALID_NEWS_PROVIDERS)
+_KNOWN_AREAS = frozenset(VALID_AREAS)
 
 
 class ValidationError(Exception):
@@ -113,7 +120,7 @@ def validate_exchange(exchange: Optional[str]) -> Optional[str]:
         return None
     
     exchange_upper = exchange.upper()
-    if exchange_upper not in VALID_EXCHANGES:
+    if exchange_upper not in _KNOWN_EXCHANGES:
         raise ValidationError(
             f"Invalid exchange '{exchange}'. Must be one of: {', '.join(VALID_EXCHANGES)}... "
             f"(and {len(VALID_EXCHANGES) - 10} more)"
@@ -134,7 +141,7 @@ def validate_timeframe(timeframe: str) -> str:
     Raises:
         ValidationError: If timeframe is invalid
     """
-    if timeframe not in VALID_TIMEFRAMES:
+    if timeframe not in _KNOWN_TIMEFRAMES:
         raise ValidationError(
             f"Invalid timeframe '{timeframe}'. Must be one of: {', '.join(VALID_TIMEFRAMES)}"
         )
@@ -155,7 +162,7 @@ def validate_news_provider(provider: str) -> Optional[str]:
         ValidationError: If provider is invalid
     """
     provider_lower = provider.lower()
-    if provider_lower not in VALID_NEWS_PROVIDERS:
+    if provider_lower not in _KNOWN_NEWS_PROVIDERS:
         raise ValidationError(
             f"Invalid news provider '{provider}'. Must be one of: {', '.join(VALID_NEWS_PROVIDERS)}"
         )
@@ -178,7 +185,7 @@ def validate_area(area: str) -> str:
         ValidationError: If area is invalid
     """
     area_lower = area.lower()
-    if area_lower not in VALID_AREAS:
+    if area_lower not in _KNOWN_AREAS:
         raise ValidationError(
             f"Invalid area '{area}'. Must be one of: {', '.join(VALID_AREAS)}"
         )
@@ -195,11 +202,8 @@ def validate_indicators(indicators: List[str]) -> tuple[List[str], List[str], Li
         indicators: List of indicator names
         
     Returns:
-        Tuple of (indicator_ids, indicator_versions, errors)
+        Tuple of (indicator_ids, indicator_versions, errors, warnings)
     """
-    indicator_ids = []
-    indicator_versions = []
-    errors = []
     warnings = []
     
     # Note: free TradingView accounts support only 2 indicators per single
@@ -215,16 +219,16 @@ def validate_indicators(indicators: List[str]) -> tuple[List[str], List[str], Li
             "around free account limits."
         )
     
-    for indicator in indicators:
-        indicator_upper = indicator.upper()
-        if indicator_upper in INDICATOR_MAPPING:
-            ind_id, ind_version = INDICATOR_MAPPING[indicator_upper]
-            indicator_ids.append(ind_id)
-            indicator_versions.append(ind_version)
-        else:
-            errors.append(
-                f"Indicator '{indicator}' not recognized. Valid indicators: {', '.join(VALID_INDICATORS)}"
-            )
+    # Upper-case each name once and test membership against the frozen set
+    upper_names = [indicator.upper() for indicator in indicators]
+    errors = [
+        f"Indicator '{indicator}' not recognized. Valid indicators: {', '.join(VALID_INDICATORS)}"
+        for indicator, name in zip(indicators, upper_names)
+        if name not in _KNOWN_INDICATORS
+    ]
+    mapped = [INDICATOR_MAPPING[name] for name in upper_names if name in _KNOWN_INDICATORS]
+    indicator_ids = [ind_id for ind_id, _ in mapped]
+    indicator_versions = [ind_version for _, ind_version in mapped]
     
     return indicator_ids, indicator_versions, errors, warnings
 
@@ -254,7 +258,7 @@ def validate_story_paths(story_paths: List[str]) -> List[str]:
     Validate story paths list.
     
     Args:
-        story_paths: List of story paths
+        story_paths: List (or tuple) of story paths
         
     Returns:
         Valid story paths list
@@ -262,18 +266,18 @@ def validate_story_paths(story_paths: List[str]) -> List[str]:
     Raises:
         ValidationError: If story_paths is empty or invalid
     """
+    if not isinstance(story_paths, (list, tuple)):
+        raise ValidationError("Story paths must be provided as a list")
+    
     if not story_paths:
         raise ValidationError("At least one story path is required")
     
-    if not isinstance(story_paths, list):
-        raise ValidationError("Story paths must be provided as a list")
-    
-    # Validate each path starts with /news/
-    invalid_paths = [p for p in story_paths if not p.startswith('/news/')]
-    if invalid_paths:
+    # Stop at the first path that does not start with /news/
+    invalid_path = next((p for p in story_paths if not p.startswith('/news/')), None)
+    if invalid_path is not None:
         raise ValidationError(
             f"Invalid story paths format. All paths must start with '/news/'. "
-            f"Invalid: {invalid_paths[:3]}..."
+            f"Invalid: {invalid_path!r}"
         )
     
     return story_paths
\ No newline at end of file
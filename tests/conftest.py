@@ -0,0 +1,21 @@
+import pytest
+
+# Tests that finish before any request reaches TradingView: argument
+# validation failures, auth rejections, and modules that mock the fetches.
+FAST_TEST_PREFIXES = ("test_invalid_", "test_empty_", "test_unauthorized")
+FAST_TEST_MODULES = (
+    "test_endpoint_update_cookies.py",
+    "test_response_cache.py",
+    "test_single_flight.py",
+    "test_cors.py",
+    "test_error_handling.py",
+)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark offline tests `fast` and live TradingView tests `slow`."""
+    for item in items:
+        if item.originalname.startswith(FAST_TEST_PREFIXES) or item.path.name in FAST_TEST_MODULES:
+            item.add_marker(pytest.mark.fast)
+        else:
+            item.add_marker(pytest.mark.slow)
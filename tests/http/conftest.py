@@ -1,15 +1,10 @@
 import pytest
-import sys
-import os
 from fastapi.testclient import TestClient
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Add project root to path so we can import vercel.index and src
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
-
 from vercel.index import app
 from src.tradingview_mcp.config import settings
 
@@ -0,0 +1,77 @@
+"""
+Tests for the CORS policy of the HTTP API.
+The allowed origins are read from the environment at import, so these tests
+load a separate copy of vercel.index with VERCEL_URL and CORS_ALLOW_ORIGINS set.
+"""
+
+import importlib.util
+
+import pytest
+from fastapi.testclient import TestClient
+
+EXTENSION_ORIGIN = "chrome-extension://" + "abcdefghijklmnop" * 2
+VERCEL_ORIGIN = "https://tv-mcp-test.vercel.app"
+EXTRA_ORIGIN = "https://dashboard.example.com"
+FOREIGN_ORIGIN = "https://evil.example.com"
+
+
+@pytest.fixture(scope="module")
+def cors_client():
+    """TestClient for an app imported with VERCEL_URL and CORS_ALLOW_ORIGINS set"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("VERCEL_URL", VERCEL_ORIGIN + "/")
+        mp.setenv("CORS_ALLOW_ORIGINS", EXTRA_ORIGIN)
+        spec = importlib.util.find_spec("vercel.index")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return TestClient(module.app)
+
+
+def preflight(client, origin):
+    return client.options("/historical-data", headers={
+        "Origin": origin,
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "Content-Type, X-Client-Key",
+    })
+
+
+class TestCors:
+    """Test which browser origins may call the API"""
+
+    @pytest.mark.parametrize("origin", [EXTENSION_ORIGIN, VERCEL_ORIGIN, EXTRA_ORIGIN])
+    def test_preflight_allowed_origin(self, cors_client, origin):
+        """Test that allowed origins pass the preflight for an authenticated POST"""
+        response = preflight(cors_client, origin)
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == origin
+        assert "POST" in response.headers["access-control-allow-methods"]
+        assert "x-client-key" in response.headers["access-control-allow-headers"].lower()
+
+    @pytest.mark.parametrize("origin", [
+        FOREIGN_ORIGIN,
+        "chrome-extension://" + "q" * 32,  # IDs only use the letters a-p
+        "chrome-extension://" + "a" * 31,
+        VERCEL_ORIGIN + ".evil.example.com",
+    ])
+    def test_preflight_foreign_origin(self, cors_client, origin):
+        """Test that other origins fail the preflight without an allow-origin header"""
+        response = preflight(cors_client, origin)
+
+        assert response.status_code == 400
+        assert "access-control-allow-origin" not in response.headers
+
+    @pytest.mark.parametrize("origin", [EXTENSION_ORIGIN, VERCEL_ORIGIN])
+    def test_simple_request_allowed_origin(self, cors_client, origin):
+        """Test that responses to allowed origins carry the allow-origin header"""
+        response = cors_client.get("/health", headers={"Origin": origin})
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == origin
+
+    def test_simple_request_foreign_origin(self, cors_client):
+        """Test that responses to other origins carry no allow-origin header"""
+        response = cors_client.get("/health", headers={"Origin": FOREIGN_ORIGIN})
+
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
@@ -3,9 +3,15 @@ Tests for /all-indicators endpoint.
 Mirrors tests/stdio/test_fetch_all_indicators.py
 """
 
+import logging
 import pytest
 from toon import decode as toon_decode
 
+logger = logging.getLogger(__name__)
+
+# Timeframes exercised by the multi-timeframe test
+TIMEFRAMES = ('1m', '5m', '1h', '1d')
+
 class TestAllIndicatorsEndpoint:
     """Test /all-indicators endpoint with real data"""
     
@@ -28,15 +34,13 @@ class TestAllIndicatorsEndpoint:
             assert isinstance(data['data'], dict)
             assert len(data['data']) > 0
         except Exception as e:
-            print(f"Toon decode failed: {e}")
+            logger.debug("Toon decode failed: %s", e)
             # Fallback: check if raw string contains expected keys
             assert "RSI" in raw_data or "MACD" in raw_data
 
     def test_indicators_different_timeframes(self, client, auth_headers):
         """Test with different timeframes"""
-        timeframes = ['1m', '5m', '1h', '1d']
-        
-        for tf in timeframes:
+        for tf in TIMEFRAMES:
             payload = {
                 "symbol": "AAPL",
                 "exchange": "NASDAQ",
@@ -3,9 +3,13 @@ Tests for /historical-data endpoint.
 Mirrors tests/stdio/test_fetch_historical_data.py
 """
 
+import json
 import pytest
 from toon import decode as toon_decode
 
+# Timeframes exercised by the multi-timeframe test
+TIMEFRAMES = ('1m', '5m', '15m', '1h', '1d')
+
 class TestHistoricalDataEndpoint:
     """Test /historical-data endpoint with real data"""
     
@@ -40,6 +44,25 @@ class TestHistoricalDataEndpoint:
         assert 'volume' in first_candle
         assert 'datetime_ist' in first_candle or 'timestamp' in first_candle
 
+    def test_json_encoding(self, client, auth_headers):
+        """Test that encoding='json' returns the same payload as a JSON string"""
+        payload = {
+            "symbol": "NIFTY",
+            "exchange": "NSE",
+            "timeframe": "1m",
+            "numb_price_candles": 10,
+            "indicators": [],
+            "encoding": "json"
+        }
+        
+        response = client.post("/historical-data", json=payload, headers=auth_headers)
+        assert response.status_code == 200
+        
+        data = json.loads(response.json()["data"])
+        assert data['success'] == True
+        assert len(data['data']) > 0
+        assert 'close' in data['data'][0]
+
     def test_ohlc_with_single_indicator(self, client, auth_headers):
         """Test with single indicator (RSI)"""
         payload = {
@@ -64,9 +87,7 @@ class TestHistoricalDataEndpoint:
 
     def test_ohlc_different_timeframes(self, client, auth_headers):
         """Test with different timeframes"""
-        timeframes = ['1m', '5m', '15m', '1h', '1d']
-        
-        for tf in timeframes:
+        for tf in TIMEFRAMES:
             payload = {
                 "symbol": "AAPL",
                 "exchange": "NASDAQ",
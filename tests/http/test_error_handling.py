@@ -0,0 +1,91 @@
+"""
+Tests for endpoint error handling: unexpected errors become 500s inside the
+router, so the responses still pass through the CORS and GZip middleware.
+The fetch_* functions are mocked, so these run offline.
+"""
+
+import pytest
+from fastapi import HTTPException
+from src.tradingview_mcp.validators import ValidationError
+
+EXTENSION_ORIGIN = "chrome-extension://" + "a" * 32
+
+
+@pytest.fixture
+def browser_headers(auth_headers):
+    """Client headers as sent by the Chrome extension"""
+    return {**auth_headers, "Origin": EXTENSION_ORIGIN}
+
+
+class TestUnexpectedErrors:
+    """Test that exceptions escaping an endpoint become 500 responses"""
+
+    @pytest.mark.parametrize("path, target, payload, prefix", [
+        ("/news-headlines", "fetch_news_headlines", {"symbol": "ERRA"}, "Failed to fetch news"),
+        ("/news-content", "fetch_news_content", {"story_paths": ["/news/x"]}, "Failed to fetch news content"),
+        ("/all-indicators", "fetch_all_indicators", {"symbol": "ERRA", "exchange": "NSE"}, "Unexpected error"),
+        ("/historical-data", "fetch_historical_data",
+         {"symbol": "ERRA", "exchange": "NSE", "timeframe": "1d", "numb_price_candles": 10}, "Unexpected error"),
+    ])
+    def test_error_becomes_500_with_cors(self, client, browser_headers, mocker, path, target, payload, prefix):
+        """Test the 500 status, prefixed detail and CORS header"""
+        mocker.patch(f"vercel.index.{target}", side_effect=RuntimeError("upstream down"))
+
+        response = client.post(path, json=payload, headers=browser_headers)
+
+        assert response.status_code == 500
+        assert response.json()["detail"] == f"{prefix}: upstream down"
+        assert response.headers["access-control-allow-origin"] == EXTENSION_ORIGIN
+
+    def test_large_error_is_gzipped(self, client, browser_headers, mocker):
+        """Test that a large 500 body is still compressed"""
+        mocker.patch("vercel.index.fetch_minds", side_effect=RuntimeError("x" * 4096))
+
+        response = client.post("/minds", json={"symbol": "ERRA", "exchange": "NSE"},
+                               headers={**browser_headers, "Accept-Encoding": "gzip"})
+
+        assert response.status_code == 500
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["detail"] == "Unexpected error: " + "x" * 4096
+
+
+class TestClientErrorsPassThrough:
+    """Test that deliberate 4xx errors are not turned into 500s"""
+
+    def test_http_exception_keeps_status(self, client, browser_headers, mocker):
+        """Test that an HTTPException raised by an endpoint keeps its status and detail"""
+        mocker.patch("vercel.index.fetch_ideas", side_effect=HTTPException(status_code=404, detail="Not here"))
+
+        response = client.post("/ideas", json={"symbol": "ERRA"}, headers=browser_headers)
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Not here"
+        assert response.headers["access-control-allow-origin"] == EXTENSION_ORIGIN
+
+    def test_validation_error_is_400(self, client, browser_headers, mocker):
+        """Test that a ValidationError raised by an endpoint is a 400 with a string detail"""
+        mocker.patch("vercel.index.fetch_news_headlines", side_effect=ValidationError("Invalid provider"))
+
+        response = client.post("/news-headlines", json={"symbol": "ERRB"}, headers=browser_headers)
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid provider"
+        assert response.headers["access-control-allow-origin"] == EXTENSION_ORIGIN
+
+    def test_unauthorized_is_403(self, client, mocker):
+        """Test that the auth dependency's HTTPException is not wrapped"""
+        mock_fetch = mocker.patch("vercel.index.fetch_all_indicators")
+
+        response = client.post("/all-indicators", json={"symbol": "ERRA", "exchange": "NSE"},
+                               headers={"X-Client-Key": "wrong-key", "Origin": EXTENSION_ORIGIN})
+
+        assert response.status_code == 403
+        assert "Unauthorized" in response.json()["detail"]
+        mock_fetch.assert_not_called()
+
+    def test_missing_field_is_422(self, client, browser_headers):
+        """Test that request body errors keep FastAPI's 422"""
+        response = client.post("/all-indicators", json={"symbol": "ERRA"}, headers=browser_headers)
+
+        assert response.status_code == 422
+        assert isinstance(response.json()["detail"], list)
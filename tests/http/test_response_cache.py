@@ -0,0 +1,93 @@
+"""
+Tests for the short-lived response caches in front of the data endpoints.
+The fetch_* functions are mocked, so these run offline.
+"""
+
+import pytest
+from vercel import index
+
+SUCCESS = {"success": True, "data": {"RSI": 55.1}}
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    """Start every test with empty response caches"""
+    for cache in index._response_caches.values():
+        cache.clear()
+    yield
+    for cache in index._response_caches.values():
+        cache.clear()
+
+
+class TestResponseCache:
+    """Test caching of encoded endpoint responses"""
+
+    def test_repeat_request_is_served_from_cache(self, client, auth_headers, mocker):
+        """Test that an identical request does not call TradingView again"""
+        mock_fetch = mocker.patch("vercel.index.fetch_all_indicators", return_value=SUCCESS)
+        payload = {"symbol": "NIFTY", "exchange": "NSE", "timeframe": "1d"}
+
+        first = client.post("/all-indicators", json=payload, headers=auth_headers)
+        second = client.post("/all-indicators", json=payload, headers=auth_headers)
+
+        assert first.status_code == 200
+        assert second.json() == first.json()
+        assert mock_fetch.call_count == 1
+
+    def test_encoding_is_part_of_the_key(self, client, auth_headers, mocker):
+        """Test that TOON and JSON responses are cached separately"""
+        mock_fetch = mocker.patch("vercel.index.fetch_all_indicators", return_value=SUCCESS)
+        payload = {"symbol": "NIFTY", "exchange": "NSE", "timeframe": "1d"}
+
+        toon = client.post("/all-indicators", json=payload, headers=auth_headers)
+        json_ = client.post("/all-indicators", json={**payload, "encoding": "json"}, headers=auth_headers)
+
+        assert mock_fetch.call_count == 2
+        assert toon.json()["data"] != json_.json()["data"]
+        assert json_.json()["data"].startswith("{")
+
+    def test_indicator_order_and_case_share_an_entry(self, client, auth_headers, mocker):
+        """Test that indicator lists differing only in order/case hit the same entry"""
+        mock_fetch = mocker.patch("vercel.index.fetch_historical_data", return_value=SUCCESS)
+        payload = {"symbol": "NIFTY", "exchange": "NSE", "timeframe": "1d", "numb_price_candles": 10}
+
+        client.post("/historical-data", json={**payload, "indicators": ["rsi", "MACD"]}, headers=auth_headers)
+        client.post("/historical-data", json={**payload, "indicators": ["MACD", "RSI"]}, headers=auth_headers)
+        assert mock_fetch.call_count == 1
+
+        client.post("/historical-data", json={**payload, "indicators": ["RSI"]}, headers=auth_headers)
+        assert mock_fetch.call_count == 2
+
+    def test_cookie_change_invalidates(self, client, auth_headers, mocker):
+        """Test that a new TradingView cookie never reuses data cached under the old one"""
+        mocker.patch("vercel.index.settings.TRADINGVIEW_COOKIE", "cookie-a")
+        mock_fetch = mocker.patch("vercel.index.fetch_ideas", return_value=SUCCESS)
+        payload = {"symbol": "NIFTY"}
+
+        client.post("/ideas", json=payload, headers=auth_headers)
+        client.post("/ideas", json=payload, headers=auth_headers)
+        assert mock_fetch.call_count == 1
+
+        index.settings.TRADINGVIEW_COOKIE = "cookie-b"
+        client.post("/ideas", json=payload, headers=auth_headers)
+        assert mock_fetch.call_count == 2
+
+    def test_failed_result_is_not_cached(self, client, auth_headers, mocker):
+        """Test that a result with success False is fetched again on the next call"""
+        mock_fetch = mocker.patch("vercel.index.fetch_minds", return_value={"success": False, "error": "rate limited"})
+        payload = {"symbol": "NIFTY", "exchange": "NSE"}
+
+        client.post("/minds", json=payload, headers=auth_headers)
+        client.post("/minds", json=payload, headers=auth_headers)
+
+        assert mock_fetch.call_count == 2
+
+    def test_empty_headlines_are_not_cached(self, client, auth_headers, mocker):
+        """Test that an empty headline list is fetched again on the next call"""
+        mock_fetch = mocker.patch("vercel.index.fetch_news_headlines", return_value=[])
+        payload = {"symbol": "AAPL", "exchange": "NASDAQ"}
+
+        client.post("/news-headlines", json=payload, headers=auth_headers)
+        client.post("/news-headlines", json=payload, headers=auth_headers)
+
+        assert mock_fetch.call_count == 2
@@ -0,0 +1,117 @@
+"""
+Tests for request coalescing in vercel.index._single_flight.
+Runs offline: produce() is a local function released by the test.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from vercel import index
+
+FOLLOWERS = 4
+
+
+class CountingLock:
+    """threading.Lock that counts releases, so the test knows when followers hold the shared Future"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cond = threading.Condition()
+        self.releases = 0
+
+    def __enter__(self):
+        self._lock.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self._lock.release()
+        with self._cond:
+            self.releases += 1
+            self._cond.notify_all()
+
+    def wait_for_releases(self, n):
+        with self._cond:
+            assert self._cond.wait_for(lambda: self.releases >= n, timeout=5)
+
+
+@pytest.fixture
+def inflight_lock(mocker):
+    lock = CountingLock()
+    mocker.patch.object(index, "_inflight_lock", lock)
+    return lock
+
+
+def run_concurrently(key, produce, started, lock):
+    """Start a leader, wait until it is inside produce(), then add followers that join it.
+
+    Returns the leader and follower futures; produce() stays blocked until the caller releases it.
+    """
+    executor = ThreadPoolExecutor(max_workers=FOLLOWERS + 1)
+    leader = executor.submit(index._single_flight, key, produce)
+    assert started.wait(timeout=5)
+    followers = [executor.submit(index._single_flight, key, produce) for _ in range(FOLLOWERS)]
+    # The leader released the lock once on entry; each follower releases it
+    # after taking the leader's Future, so all of them are now attached to it
+    lock.wait_for_releases(1 + FOLLOWERS)
+    executor.shutdown(wait=False)
+    return leader, followers
+
+
+class TestSingleFlight:
+    """Test that concurrent identical requests share one upstream call"""
+
+    def test_concurrent_callers_share_one_call(self, inflight_lock):
+        """Test that followers get the leader's result without calling produce()"""
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def produce():
+            calls.append(1)
+            started.set()
+            assert release.wait(timeout=5)
+            return "encoded-data"
+
+        leader, followers = run_concurrently(("test", "share"), produce, started, inflight_lock)
+        release.set()
+
+        assert leader.result(timeout=5) == "encoded-data"
+        assert [f.result(timeout=5) for f in followers] == ["encoded-data"] * FOLLOWERS
+        assert len(calls) == 1
+        assert ("test", "share") not in index._inflight
+
+    def test_error_reaches_every_waiter(self, inflight_lock):
+        """Test that an exception from produce() is raised in the leader and every follower"""
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def produce():
+            calls.append(1)
+            started.set()
+            assert release.wait(timeout=5)
+            raise RuntimeError("upstream down")
+
+        leader, followers = run_concurrently(("test", "error"), produce, started, inflight_lock)
+        release.set()
+
+        for future in [leader] + followers:
+            with pytest.raises(RuntimeError, match="upstream down"):
+                future.result(timeout=5)
+        assert len(calls) == 1
+
+    def test_key_is_cleared_after_failure(self):
+        """Test that a failed call does not poison the key for later requests"""
+        def failing():
+            raise RuntimeError("upstream down")
+
+        with pytest.raises(RuntimeError):
+            index._single_flight(("test", "retry"), failing)
+        assert ("test", "retry") not in index._inflight
+
+        assert index._single_flight(("test", "retry"), lambda: "fresh") == "fresh"
+        assert ("test", "retry") not in index._inflight
+
+    def test_different_keys_do_not_share(self):
+        """Test that requests with different keys each run their own produce()"""
+        assert index._single_flight(("test", "a"), lambda: "a") == "a"
+        assert index._single_flight(("test", "b"), lambda: "b") == "b"
@@ -0,0 +1,17 @@
+import pytest
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+from tradingview_mcp.tradingview_tools import fetch_news_headlines
+
+@pytest.fixture(scope="module")
+def aapl_americas_headlines():
+    """AAPL/NASDAQ americas headlines, fetched once per module and shared by its tests"""
+    return fetch_news_headlines(
+        symbol='AAPL',
+        exchange='NASDAQ',
+        provider='all',
+        area='americas'
+    )
@@ -3,31 +3,38 @@ Real tests for fetch_all_indicators function.
 Tests with actual TradingView data - no mocks.
 """
 
+import logging
 import pytest
-import os
-import sys
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from tradingview_mcp.tradingview_tools import fetch_all_indicators
 from tradingview_mcp.validators import ValidationError
 
+logger = logging.getLogger(__name__)
+
+# Timeframes exercised by the multi-timeframe test
+TIMEFRAMES = ('1m', '5m', '1h', '1d')
+
+
+@pytest.fixture(scope="module")
+def nifty_1m_indicators():
+    """NIFTY/NSE 1m snapshot, fetched once and shared by the tests below"""
+    return fetch_all_indicators(
+        symbol='NIFTY',
+        exchange='NSE',
+        timeframe='1m'
+    )
+
 
 class TestFetchAllIndicators:
     """Test fetch_all_indicators with real data"""
     
-    def test_basic_indicators_fetch(self):
+    def test_basic_indicators_fetch(self, nifty_1m_indicators):
         """Test fetching all indicators"""
-        result = fetch_all_indicators(
-            symbol='NIFTY',
-            exchange='NSE',
-            timeframe='1m'
-        )
+        result = nifty_1m_indicators
         
         assert result['success'] == True
         assert 'data' in result
@@ -36,9 +43,7 @@ class TestFetchAllIndicators:
     
     def test_indicators_different_timeframes(self):
         """Test with different timeframes"""
-        timeframes = ['1m', '5m', '1h', '1d']
-        
-        for tf in timeframes:
+        for tf in TIMEFRAMES:
             result = fetch_all_indicators(
                 symbol='AAPL',
                 exchange='NASDAQ',
@@ -47,37 +52,26 @@ class TestFetchAllIndicators:
             
             assert result['success'] == True
             assert len(result['data']) > 0
-            print(f"✓ Timeframe {tf} works")
-    
-    def test_indicators_crypto_symbols(self):
-        """Test with crypto symbols"""
-        result = fetch_all_indicators(
-            symbol='BTCUSD',
-            exchange='BINANCE',
-            timeframe='5m'
-        )
-        
-        assert result['success'] == True
-        assert len(result['data']) > 0
+            logger.debug("✓ Timeframe %s works", tf)
     
-    def test_indicators_stock_symbols(self):
-        """Test with stock symbols"""
+    @pytest.mark.parametrize("symbol,exchange,timeframe", [
+        ('BTCUSD', 'BINANCE', '5m'),
+        ('TSLA', 'NASDAQ', '1h'),
+    ], ids=['crypto', 'stock'])
+    def test_indicators_symbol_types(self, symbol, exchange, timeframe):
+        """Test with crypto and stock symbols"""
         result = fetch_all_indicators(
-            symbol='TSLA',
-            exchange='NASDAQ',
-            timeframe='1h'
+            symbol=symbol,
+            exchange=exchange,
+            timeframe=timeframe
         )
         
         assert result['success'] == True
         assert len(result['data']) > 0
     
-    def test_indicators_data_structure(self):
+    def test_indicators_data_structure(self, nifty_1m_indicators):
         """Test indicators data structure"""
-        result = fetch_all_indicators(
-            symbol='NIFTY',
-            exchange='NSE',
-            timeframe='1m'
-        )
+        result = nifty_1m_indicators
         
         assert result['success'] == True
         assert 'data' in result
@@ -88,7 +82,7 @@ class TestFetchAllIndicators:
     
     def test_invalid_exchange(self):
         """Test with invalid exchange"""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match='Invalid exchange'):
             fetch_all_indicators(
                 symbol='NIFTY',
                 exchange='INVALID_EXCHANGE',
@@ -97,20 +91,16 @@ class TestFetchAllIndicators:
     
     def test_invalid_timeframe(self):
         """Test with invalid timeframe"""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match='Invalid timeframe'):
             fetch_all_indicators(
                 symbol='NIFTY',
                 exchange='NSE',
                 timeframe='3m'
             )
     
-    def test_indicators_common_indicators_present(self):
+    def test_indicators_common_indicators_present(self, nifty_1m_indicators):
         """Test that common indicators are present"""
-        result = fetch_all_indicators(
-            symbol='NIFTY',
-            exchange='NSE',
-            timeframe='1m'
-        )
+        result = nifty_1m_indicators
         
         assert result['success'] == True
         
@@ -3,32 +3,36 @@ Real tests for fetch_ideas function.
 Tests with actual TradingView data - no mocks.
 """
 
+import logging
 import pytest
-import os
-import sys
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from tradingview_mcp.tradingview_tools import fetch_ideas
 from tradingview_mcp.validators import ValidationError
 
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(scope="module")
+def nifty_popular_ideas():
+    """First page of popular NIFTY ideas, fetched once and shared by the tests below"""
+    return fetch_ideas(
+        symbol='NIFTY',
+        startPage=1,
+        endPage=1,
+        sort='popular'
+    )
+
 
 class TestFetchIdeas:
     """Test fetch_ideas with real data"""
     
-    def test_basic_ideas_fetch(self):
+    def test_basic_ideas_fetch(self, nifty_popular_ideas):
         """Test fetching ideas"""
-        result = fetch_ideas(
-            symbol='NIFTY',
-            startPage=1,
-            endPage=1,
-            sort='popular'
-        )
+        result = nifty_popular_ideas
         
         assert result['success'] == True
         assert 'ideas' in result
@@ -83,11 +87,11 @@ class TestFetchIdeas:
             )
             
             assert result['success'] == True
-            print(f"✓ Symbol {symbol} works")
+            logger.debug("✓ Symbol %s works", symbol)
     
     def test_invalid_sort_option(self):
         """Test with invalid sort option"""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match='sort must be either'):
             fetch_ideas(
                 symbol='NIFTY',
                 startPage=1,
@@ -97,7 +101,7 @@ class TestFetchIdeas:
     
     def test_invalid_page_range(self):
         """Test with invalid page range (end < start)"""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match='endPage must be greater than or equal to startPage'):
             fetch_ideas(
                 symbol='NIFTY',
                 startPage=3,
@@ -107,7 +111,7 @@ class TestFetchIdeas:
     
     def test_invalid_start_page_type(self):
         """Test with invalid start_page type"""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match='startPage must be a valid integer'):
             fetch_ideas(
                 symbol='NIFTY',
                 startPage='invalid',
@@ -115,21 +119,16 @@ class TestFetchIdeas:
                 sort='popular'
             )
     
-    def test_ideas_structure(self):
+    def test_ideas_structure(self, nifty_popular_ideas):
         """Test ideas data structure"""
-        result = fetch_ideas(
-            symbol='NIFTY',
-            startPage=1,
-            endPage=1,
-            sort='popular'
-        )
+        result = nifty_popular_ideas
         
         assert result['success'] == True
         assert 'ideas' in result
         assert 'count' in result
         
         # If ideas are present, check structure
-        if len(result['ideas']) > 0:
+        if result['ideas']:
             idea = result['ideas'][0]
             assert isinstance(idea, dict)
 
@@ -3,20 +3,18 @@ Real tests for fetch_minds function.
 Tests with actual TradingView data - no mocks.
 """
 
+import logging
 import pytest
-import os
-import sys
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from tradingview_mcp.tradingview_tools import fetch_minds
 from tradingview_mcp.validators import ValidationError
 
+logger = logging.getLogger(__name__)
+
 
 class TestFetchMinds:
     """Test fetch_minds with real data"""
@@ -60,7 +58,7 @@ class TestFetchMinds:
             )
             
             assert result['success'] == True
-            print(f"✓ {symbol} on {exchange} works")
+            logger.debug("✓ %s on %s works", symbol, exchange)
     
     def test_minds_with_limit(self):
         """Test with specific limit"""
@@ -75,7 +73,7 @@ class TestFetchMinds:
     
     def test_invalid_exchange(self):
         """Test with invalid exchange"""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match='Invalid exchange'):
             fetch_minds(
                 symbol='NIFTY',
                 exchange='INVALID_EXCHANGE',
@@ -84,7 +82,7 @@ class TestFetchMinds:
     
     def test_invalid_limit_negative(self):
         """Test with negative limit"""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match='limit must be a positive integer'):
             fetch_minds(
                 symbol='NIFTY',
                 exchange='NSE',
@@ -93,7 +91,7 @@ class TestFetchMinds:
     
     def test_invalid_limit_zero(self):
         """Test with zero limit"""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match='limit must be a positive integer'):
             fetch_minds(
                 symbol='NIFTY',
                 exchange='NSE',
@@ -112,7 +110,7 @@ class TestFetchMinds:
         assert 'data' in result
         
         # If data is present, check structure
-        if len(result['data']) > 0:
+        if result['data']:
             mind = result['data'][0]
             assert isinstance(mind, dict)
 
@@ -4,16 +4,11 @@ Tests with actual TradingView data - no mocks.
 """
 
 import pytest
-import os
-import sys
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from tradingview_mcp.tradingview_tools import fetch_news_headlines, fetch_news_content
 from tradingview_mcp.validators import ValidationError
 
@@ -21,17 +16,11 @@ from tradingview_mcp.validators import ValidationError
 class TestFetchNewsContent:
     """Test fetch_news_content with real data"""
     
-    def test_basic_news_content_fetch(self):
+    def test_basic_news_content_fetch(self, aapl_americas_headlines):
         """Test fetching news content from headlines"""
-        # First get headlines
-        headlines = fetch_news_headlines(
-            symbol='AAPL',
-            exchange='NASDAQ',
-            provider='all',
-            area='americas'
-        )
+        headlines = aapl_americas_headlines
         
-        if len(headlines) > 0 and 'storyPath' in headlines[0]:
+        if headlines and 'storyPath' in headlines[0]:
             story_path = headlines[0]['storyPath']
             
             # Fetch content
@@ -53,7 +42,7 @@ class TestFetchNewsContent:
             area='world'
         )
         
-        if len(headlines) > 0 and 'storyPath' in headlines[0]:
+        if headlines and 'storyPath' in headlines[0]:
             story_paths = [headlines[0]['storyPath']]
             result = fetch_news_content(story_paths)
             
@@ -72,7 +61,7 @@ class TestFetchNewsContent:
         
         story_paths = [h['storyPath'] for h in headlines[:3] if 'storyPath' in h]
         
-        if len(story_paths) > 0:
+        if story_paths:
             result = fetch_news_content(story_paths)
             
             assert isinstance(result, list)
@@ -80,29 +69,23 @@ class TestFetchNewsContent:
     
     def test_invalid_story_path_format(self):
         """Test with invalid story path format"""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="must start with '/news/'"):
             fetch_news_content(['invalid_path'])
     
     def test_empty_story_paths(self):
         """Test with empty story paths list"""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match='At least one story path'):
             fetch_news_content([])
     
-    def test_news_content_structure(self):
+    def test_news_content_structure(self, aapl_americas_headlines):
         """Test news content structure"""
-        # Get headlines first
-        headlines = fetch_news_headlines(
-            symbol='AAPL',
-            exchange='NASDAQ',
-            provider='all',
-            area='americas'
-        )
+        headlines = aapl_americas_headlines
         
-        if len(headlines) > 0 and 'storyPath' in headlines[0]:
+        if headlines and 'storyPath' in headlines[0]:
             story_path = headlines[0]['storyPath']
             result = fetch_news_content([story_path])
             
-            if len(result) > 0:
+            if result:
                 content = result[0]
                 assert 'success' in content
                 
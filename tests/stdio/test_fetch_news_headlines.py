@@ -3,35 +3,28 @@ Real tests for fetch_news_headlines function.
 Tests with actual TradingView data - no mocks.
 """
 
+import logging
 import pytest
-import os
-import sys
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from tradingview_mcp.tradingview_tools import fetch_news_headlines
 from tradingview_mcp.validators import ValidationError
 
+logger = logging.getLogger(__name__)
+
 
 class TestFetchNewsHeadlines:
     """Test fetch_news_headlines with real data"""
     
-    def test_basic_news_fetch(self):
+    def test_basic_news_fetch(self, aapl_americas_headlines):
         """Test fetching news headlines"""
-        result = fetch_news_headlines(
-            symbol='AAPL',
-            exchange='NASDAQ',
-            provider='all',
-            area='americas'
-        )
+        result = aapl_americas_headlines
         
         assert isinstance(result, list)
-        if len(result) > 0:
+        if result:
             headline = result[0]
             assert 'title' in headline
             assert 'storyPath' in headline or 'url' in headline
@@ -49,7 +42,7 @@ class TestFetchNewsHeadlines:
             )
             
             assert isinstance(result, list)
-            print(f"✓ Provider {provider} works")
+            logger.debug("✓ Provider %s works", provider)
     
     def test_news_different_areas(self):
         """Test with different geographical areas"""
@@ -64,7 +57,7 @@ class TestFetchNewsHeadlines:
             )
             
             assert isinstance(result, list)
-            print(f"✓ Area {area} works")
+            logger.debug("✓ Area %s works", area)
     
     def test_news_without_exchange(self):
         """Test without specifying exchange - should use default behavior"""
@@ -94,36 +87,29 @@ class TestFetchNewsHeadlines:
         
         assert isinstance(result, list)
     
-    def test_invalid_area(self):
-        """Test with invalid area"""
-        with pytest.raises(ValidationError):
-            fetch_news_headlines(
-                symbol='AAPL',
-                exchange='NASDAQ',
-                provider='all',
-                area='invalid_area'
-            )
+    @pytest.mark.parametrize("overrides,message", [
+        ({'area': 'invalid_area'}, "Invalid area"),
+        ({'exchange': 'INVALID_EXCHANGE'}, "Invalid exchange"),
+        ({'provider': 'invalid_provider'}, "Invalid news provider"),
+        ({'symbol': ''}, "Symbol is required"),
+    ], ids=['area', 'exchange', 'provider', 'empty_symbol'])
+    def test_invalid_parameters(self, overrides, message):
+        """Test that invalid parameters raise ValidationError before any fetch"""
+        kwargs = {
+            'symbol': 'AAPL',
+            'exchange': 'NASDAQ',
+            'provider': 'all',
+            'area': 'americas',
+            **overrides
+        }
+        with pytest.raises(ValidationError, match=message):
+            fetch_news_headlines(**kwargs)
     
-    def test_invalid_exchange(self):
-        """Test with invalid exchange"""
-        with pytest.raises(ValidationError):
-            fetch_news_headlines(
-                symbol='AAPL',
-                exchange='INVALID_EXCHANGE',
-                provider='all',
-                area='americas'
-            )
-    
-    def test_news_headline_structure(self):
+    def test_news_headline_structure(self, aapl_americas_headlines):
         """Test that headlines have correct structure"""
-        result = fetch_news_headlines(
-            symbol='AAPL',
-            exchange='NASDAQ',
-            provider='all',
-            area='americas'
-        )
+        result = aapl_americas_headlines
         
-        if len(result) > 0:
+        if result:
             headline = result[0]
             
             # Check for required fields
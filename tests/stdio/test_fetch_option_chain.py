@@ -3,20 +3,18 @@ Real tests for fetch_option_chain functions.
 Tests with actual TradingView data - no mocks.
 """
 
+import logging
 import pytest
-import os
-import sys
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from tradingview_mcp.tradingview_tools import fetch_option_chain_data, process_option_chain_with_analysis
 from tradingview_mcp.validators import ValidationError
 
+logger = logging.getLogger(__name__)
+
 
 class TestFetchOptionChain:
     """Test option chain functions with real data"""
@@ -136,7 +134,7 @@ class TestFetchOptionChain:
             assert result['success'] == True
             assert result['requested_ITM'] == itm
             assert result['requested_OTM'] == otm
-            print(f"✓ ITM={itm}, OTM={otm} works - returned {len(result['data'])} options")
+            logger.debug("✓ ITM=%s, OTM=%s works - returned %d options", itm, otm, len(result['data']))
     
     def test_option_chain_banknifty(self):
         """Test with BANKNIFTY symbol"""
@@ -153,7 +151,7 @@ class TestFetchOptionChain:
     
     def test_invalid_exchange(self):
         """Test with invalid exchange"""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match='Invalid exchange'):
             process_option_chain_with_analysis(
                 symbol='NIFTY',
                 exchange='INVALID_EXCHANGE',
@@ -164,7 +162,7 @@ class TestFetchOptionChain:
     
     def test_invalid_itm_zero(self):
         """Test with zero no_of_ITM"""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match='no_of_ITM must be between 1 and 20'):
             process_option_chain_with_analysis(
                 symbol='NIFTY',
                 exchange='NSE',
@@ -175,7 +173,7 @@ class TestFetchOptionChain:
     
     def test_invalid_otm_negative(self):
         """Test with negative no_of_OTM"""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match='no_of_OTM must be between 1 and 20'):
             process_option_chain_with_analysis(
                 symbol='NIFTY',
                 exchange='NSE',
@@ -186,7 +184,7 @@ class TestFetchOptionChain:
     
     def test_invalid_itm_too_high(self):
         """Test with no_of_ITM exceeding limit"""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match='no_of_ITM must be between 1 and 20'):
             process_option_chain_with_analysis(
                 symbol='NIFTY',
                 exchange='NSE',
@@ -1,32 +1,82 @@
 """
 Deployment script for TradingView MCP to Vercel.
-Generates requirements.txt from pyproject.toml, syncs local .env variables to Vercel Project Settings, and then deploys.
+Ensures uv.lock exists (Vercel installs with uv from pyproject.toml + uv.lock), syncs local .env variables to Vercel Project Settings, and then deploys.
 """
 
 import os
 import sys
+import json
+import re
+import time
+import hashlib
+import shutil
 import subprocess
-from dotenv import dotenv_values
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import dotenv_values, load_dotenv
 from pathlib import Path
 
+# Populate os.environ from .env (existing shell variables take precedence)
+load_dotenv()
+
 # Required environment variables to check
-REQUIRED_ENV_VARS = [
+REQUIRED_ENV_VARS = frozenset({
     "TRADINGVIEW_COOKIE",
     "VERCEL_URL",
     "TRADINGVIEW_URL",
     "TV_ADMIN_KEY",
     "TV_CLIENT_KEY"
-]
+})
+
+# Resolve CLI paths once so each call skips the PATH search, and so
+# Windows .cmd shims can be launched without a shell. UV is None when
+# `uv` is not installed.
+VERCEL = shutil.which("vercel") or "vercel"
+UV = shutil.which("uv")
+
+PROJECT_ROOT = Path(__file__).parent.parent
+PYPROJECT_PATH = PROJECT_ROOT / "pyproject.toml"
+LOCK_PATH = PROJECT_ROOT / "uv.lock"
+
+# Per-user cache of probed CLI capabilities
+CAPS_CACHE_DIR = Path.home() / ".cache" / "tv-mcp"
+UV_CAPS_PATH = CAPS_CACHE_DIR / "uv-caps.json"
+UV_VERSION_PATH = CAPS_CACHE_DIR / "uv-version.json"
+VERCEL_CAPS_PATH = CAPS_CACHE_DIR / "vercel-caps.json"
+CLI_VERSION_TTL = 24 * 3600  # seconds
+
+# Serializes status lines written by upload worker threads
+_log_lock = threading.Lock()
+
+# Deploy-time settings that configure this script and are never uploaded
+DEPLOY_ONLY_ENV_VARS = frozenset({
+    "VERCEL_TOKEN",
+    "VERCEL_PROJECT_ID",
+    "VERCEL_ORG_ID",
+    "VERCEL_DEPLOY_CONCURRENCY"
+})
+
+VERCEL_API_URL = "https://api.vercel.com"
+
+# Vercel environment the variables are listed from and uploaded to
+VERCEL_ENV_TARGET = "production"
+
+# First token of each `vercel env ls` row; table rows are indented
+_VAR_NAME_RE = re.compile(r"^[ \t]*([A-Za-z_]\w*)(?=\s|$)", re.MULTILINE | re.ASCII)
+
+# Names of variables already set on Vercel, cached between runs
+ENV_LS_CACHE_PATH = Path(__file__).parent / ".env_ls.cache.json"
+ENV_LS_CACHE_TTL = 300  # seconds
 
 def check_env_vars():
-    """Check if all required environment variables are set locally."""
-    # dotenv_values loads vars from .env file directly (not os.environ)
+    """Check if all required environment variables are set in .env."""
+    # Check the file itself, not os.environ: push_env_vars uploads from .env,
+    # so a variable exported only in the shell would never reach Vercel
     config = dotenv_values(".env")
-    missing = []
-    
-    for var in REQUIRED_ENV_VARS:
-        if var not in config or not config[var]:
-            missing.append(var)
+    missing = sorted(var for var in REQUIRED_ENV_VARS if not config.get(var))
             
     if missing:
         print(f"❌ Missing required environment variables in .env: {', '.join(missing)}")
@@ -34,12 +84,47 @@ def check_env_vars():
     print("✅ All required environment variables are present locally.")
     return True
 
+def _cli_version(binary: str, cache_path: Path):
+    """Return `<binary> --version` output, or None if the command fails.
+
+    The result is cached for a day per exact binary (path, mtime, inode), so
+    an upgrade or reinstall is probed again. Raises OSError if the binary
+    cannot be run at all.
+    """
+    try:
+        st = os.stat(binary)
+        key = f"{binary}:{st.st_mtime_ns}:{st.st_ino}"
+    except OSError:
+        # Not resolved on PATH; let the run below report it
+        key = None
+
+    if key:
+        try:
+            cache = json.loads(cache_path.read_text())
+            if cache["key"] == key and time.time() - cache["ts"] < CLI_VERSION_TTL:
+                return cache["version"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    result = subprocess.run([binary, "--version"], capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+
+    version = result.stdout.strip()
+    if key:
+        try:
+            CAPS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps({"key": key, "version": version, "ts": time.time()}))
+        except OSError:
+            pass
+    return version
+
 def check_vercel_cli():
     """Check if Vercel CLI is installed."""
     try:
-        result = subprocess.run("vercel --version", shell=True, capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"✅ Vercel CLI detected: {result.stdout.strip()}")
+        version = _cli_version(VERCEL, VERCEL_CAPS_PATH)
+        if version is not None:
+            print(f"✅ Vercel CLI detected: {version}")
             return True
         else:
             print("❌ Vercel CLI is not working properly.")
@@ -49,11 +134,44 @@ def check_vercel_cli():
         return False
 
 
+def _probe_uv_lock_args(project_root: Path):
+    """Work out which `uv` arguments create a lockfile, or None if none do."""
+    lock_help = subprocess.run([UV, "lock", "--help"], cwd=str(project_root), capture_output=True, text=True)
+    if lock_help.returncode == 0:
+        return ["lock"]
+
+    # Older `uv` releases without a `lock` subcommand locked through `uv add`
+    add_help = subprocess.run([UV, "add", "--help"], cwd=str(project_root), capture_output=True, text=True)
+    if add_help.returncode == 0:
+        if "--lock-file" in add_help.stdout:
+            return ["add", "--lock-file", "uv.lock"]
+        if "--lock" in add_help.stdout:
+            return ["add", "--lock"]
+    return None
+
+def _uv_lock_args(uv_version: str, project_root: Path):
+    """Return the lock command for this `uv` version, probing only on a cache miss."""
+    try:
+        caps = json.loads(UV_CAPS_PATH.read_text())
+        if caps["version"] == uv_version:
+            return caps["lock_args"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    lock_args = _probe_uv_lock_args(project_root)
+    try:
+        CAPS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        UV_CAPS_PATH.write_text(json.dumps({"version": uv_version, "lock_args": lock_args}))
+    except OSError:
+        pass
+    return lock_args
+
 def ensure_uv_lock(project_root: Path, lock_path: Path):
     """Ensure `uv.lock` exists. Try to generate it using the `uv` CLI if missing.
 
-    This is best-effort: we try a few common `uv` commands to create/update
-    the lockfile. If the `uv` CLI is not installed or all attempts fail,
+    This is best-effort: the lock command supported by the installed `uv`
+    is probed once per `uv` version (cached in ~/.cache/tv-mcp/uv-caps.json)
+    and run. If the `uv` CLI is not installed or the command fails,
     the function will return False and print instructions for manual steps.
     """
     if lock_path.exists():
@@ -63,9 +181,14 @@ def ensure_uv_lock(project_root: Path, lock_path: Path):
     print("🔧 No uv.lock found — attempting to generate one locally using `uv`...")
 
     # Check if `uv` CLI is available
+    if UV is None:
+        print("⚠️  `uv` CLI not found locally. Install it to auto-generate uv.lock or create uv.lock manually.")
+        print("   Install: pip install uv")
+        return False
+
     try:
-        uv_check = subprocess.run("uv --version", shell=True, capture_output=True, text=True)
-        if uv_check.returncode != 0:
+        uv_version = _cli_version(UV, UV_VERSION_PATH)
+        if uv_version is None:
             print("⚠️  `uv` CLI not found locally. Install it to auto-generate uv.lock or create uv.lock manually.")
             print("   Install: pip install uv")
             return False
@@ -73,33 +196,27 @@ def ensure_uv_lock(project_root: Path, lock_path: Path):
         print("⚠️  Could not run `uv --version`. Is `uv` installed and on PATH?")
         return False
 
-    # Try a sequence of commands that may create a lockfile. These are best-effort;
-    # different versions of `uv` expose slightly different flags.
-    candidates = [
-        "uv lock",
-        "uv lock --output uv.lock",
-        "uv lock -o uv.lock",
-        "uv add --lock",
-        "uv add --lock-file uv.lock",
-    ]
+    # Different versions of `uv` expose slightly different lock commands
+    try:
+        args = _uv_lock_args(uv_version, project_root)
+    except Exception as e:
+        print(f"   Exception probing `uv` lock support: {e}")
+        args = None
 
-    for cmd in candidates:
+    if args:
+        cmd = " ".join(["uv", *args])
         print(f"   -> Running: {cmd}")
         try:
-            result = subprocess.run(cmd, shell=True, cwd=str(project_root), capture_output=True, text=True)
-            if result.returncode == 0:
-                if lock_path.exists():
-                    print("✅ uv.lock generated successfully.")
-                    return True
-                # sometimes uv writes to stdout or another path; check for typical output
-                if "lock" in (result.stdout or "").lower():
-                    print("✅ uv command completed; check uv.lock in repo root.")
-                    if lock_path.exists():
-                        return True
-            else:
+            result = subprocess.run([UV, *args], cwd=str(project_root), capture_output=True, text=True)
+            if result.returncode == 0 and lock_path.exists():
+                print("✅ uv.lock generated successfully.")
+                return True
+            if result.returncode != 0:
                 print(f"   (failed) {result.stderr.splitlines()[-1] if result.stderr else result.stdout}")
         except Exception as e:
             print(f"   Exception running {cmd}: {e}")
+    else:
+        print("   (failed) installed `uv` has no known command for creating a lockfile")
 
     print("❌ Failed to auto-generate uv.lock. Options:")
     print("   1) Install `uv` locally and run `uv lock` in the repo root to produce uv.lock.")
@@ -107,80 +224,242 @@ def ensure_uv_lock(project_root: Path, lock_path: Path):
     print("   3) Change `vercel.json` to use `pip` installer instead of `uv` if you prefer pip-based builds.")
     return False
 
-def push_env_vars(force: bool = False):
-    """
-    Reads .env and pushes variables to Vercel Production environment.
-    Uses 'vercel env add' command.
-    """
-    print("🔄 Syncing environment variables to Vercel...")
+def _vercel_project_ids():
+    """Return (project_id, org_id) from the environment or .vercel/project.json."""
+    project_id = os.getenv("VERCEL_PROJECT_ID")
+    org_id = os.getenv("VERCEL_ORG_ID")
+    if not project_id:
+        try:
+            linked = json.loads((Path(".vercel") / "project.json").read_text())
+            project_id = linked.get("projectId")
+            org_id = org_id or linked.get("orgId")
+        except (OSError, ValueError):
+            pass
+    return project_id, org_id
 
-    # Load variables specifically from the .env file
-    env_vars = dotenv_values(".env")
+def _upsert_via_api(pending, token: str, project_id: str, org_id=None):
+    """Upsert all variables in one Vercel REST API request. Returns [(key, ok, err), ...]."""
+    query = {"upsert": "true"}
+    # Team-owned projects must be addressed with their team id
+    if org_id and org_id.startswith("team_"):
+        query["teamId"] = org_id
+    url = f"{VERCEL_API_URL}/v10/projects/{urllib.parse.quote(project_id, safe='')}/env?{urllib.parse.urlencode(query)}"
+    body = json.dumps([
+        {"key": key, "value": str(value), "type": "encrypted", "target": [VERCEL_ENV_TARGET]}
+        for key, value in pending
+    ]).encode()
+    request = urllib.request.Request(
+        url,
+        data=body,
+        method="POST",
+        headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+    )
 
-    # Query existing environment variable names in Vercel (production) once
     try:
-        ls = subprocess.run(
-            "vercel env ls production",
-            shell=True,
-            capture_output=True,
+        with urllib.request.urlopen(request, timeout=30) as response:
+            result = json.loads(response.read() or b"{}")
+    except urllib.error.HTTPError as e:
+        detail = e.read().decode(errors="replace").strip()
+        return [(key, False, f"Error: HTTP {e.code} {detail}") for key, _ in pending]
+    except Exception as e:
+        return [(key, False, f"Exception: {e}") for key, _ in pending]
+
+    # Batch responses list per-variable failures; everything else was upserted
+    failed = {}
+    for item in result.get("failed") or []:
+        error = item.get("error") or {}
+        failed_key = error.get("envVarKey") or error.get("key")
+        if failed_key:
+            failed[failed_key] = error.get("message") or error.get("code") or "unknown error"
+    return [
+        (key, key not in failed, f"Error: {failed[key]}" if key in failed else None)
+        for key, _ in pending
+    ]
+
+def _env_ls_cache_key() -> str:
+    """Hash of the linked Vercel project, target environment and .env, so a cache
+    never outlives a re-link, a different target or an edited .env."""
+    digest = hashlib.sha256(VERCEL_ENV_TARGET.encode())
+    for path in (Path(".vercel") / "project.json", Path(".env")):
+        digest.update(b"\0")
+        digest.update(path.read_bytes() if path.exists() else b"")
+    return digest.hexdigest()
+
+def _load_env_ls_cache():
+    """Return cached Vercel env names if the cache is fresh and its key matches, else None."""
+    try:
+        cache = json.loads(ENV_LS_CACHE_PATH.read_text())
+        if time.time() - cache["ts"] < ENV_LS_CACHE_TTL and cache["hash"] == _env_ls_cache_key():
+            return frozenset(cache["names"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def _save_env_ls_cache(names):
+    """Persist Vercel env names for the next run (best-effort)."""
+    try:
+        ENV_LS_CACHE_PATH.write_text(json.dumps({
+            "ts": time.time(),
+            "hash": _env_ls_cache_key(),
+            "names": sorted(names)
+        }))
+    except OSError:
+        pass
+
+def _report(key: str, ok: bool, err=None):
+    """Write one complete status line for a variable, safe to call from worker threads."""
+    line = f"   - Set {key}: {'✅' if ok else '❌ ' + err}\n"
+    with _log_lock:
+        sys.stdout.write(line)
+        sys.stdout.flush()
+
+def _upload(key: str, value: bytes, force: bool):
+    """Upload a single variable to Vercel production. Returns (key, ok, err)."""
+    try:
+        if force:
+            # Remove existing variable first (ignore errors). This must finish
+            # before the add: overlapping them lets the rm delete the new value,
+            # or the add fail on the still-existing key.
+            subprocess.run([VERCEL, "env", "rm", key, VERCEL_ENV_TARGET, "-y"], capture_output=True)
+
+        process = subprocess.run(
+            [VERCEL, "env", "add", key, VERCEL_ENV_TARGET],
+            input=value,
+            capture_output=True
+        )
+
+        if process.returncode == 0:
+            return key, True, None
+        return key, False, f"Error: {process.stderr.decode(errors='replace').strip()}"
+
+    except Exception as e:
+        return key, False, f"Exception: {e}"
+
+def _upload_one(key: str, value: bytes, force: bool):
+    """Upload one variable and report its status line. Returns (key, ok, err)."""
+    key, ok, err = _upload(key, value, force)
+    _report(key, ok, err)
+    return key, ok, err
+
+def _start_env_ls():
+    """Start `vercel env ls` without waiting for it. Returns the process, or None if it failed to start."""
+    try:
+        # No stdin: a login/link prompt from the CLI must not read the user's keystrokes
+        return subprocess.Popen(
+            [VERCEL, "env", "ls", VERCEL_ENV_TARGET],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True
         )
-        vercel_envs_out = ls.stdout or ""
+    except Exception:
+        return None
+
+def fetch_existing_env_names(ls_process=None):
+    """Return the names of production variables already set on Vercel.
+
+    `ls_process` may be a listing already started by _start_env_ls().
+    """
+    if ls_process is None:
+        cached = _load_env_ls_cache()
+        if cached is not None:
+            return cached
+        ls_process = _start_env_ls()
+
+    # Query existing environment variable names in Vercel (production) once
+    try:
+        vercel_envs_out = (ls_process.communicate()[0] if ls_process else "") or ""
     except Exception:
         vercel_envs_out = ""
 
-    def exists_on_vercel(varname: str) -> bool:
-        # crude but effective: check if the var name appears at the start of any line
-        for line in vercel_envs_out.splitlines():
-            parts = line.strip().split()
-            if not parts:
-                continue
-            if parts[0] == varname:
-                return True
-        return False
+    # crude but effective: a variable exists if its name starts a line of the listing
+    existing = frozenset(_VAR_NAME_RE.findall(vercel_envs_out))
+    if vercel_envs_out:
+        _save_env_ls_cache(existing)
+    return existing
+
+def _deploy_concurrency(default: int = 8) -> int:
+    """Number of parallel `vercel env add` workers from VERCEL_DEPLOY_CONCURRENCY."""
+    raw = os.getenv("VERCEL_DEPLOY_CONCURRENCY")
+    if raw is None:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        print(f"⚠️  Ignoring invalid VERCEL_DEPLOY_CONCURRENCY={raw!r}; using {default} workers.")
+        return default
+
+def push_env_vars(force: bool = False, existing=None) -> bool:
+    """
+    Reads .env and pushes variables to Vercel Production environment.
+    With VERCEL_TOKEN set, all variables are upserted in one REST API
+    request; otherwise uses 'vercel env add' command, uploading variables
+    concurrently (VERCEL_DEPLOY_CONCURRENCY workers, default 8).
+
+    `existing` may carry names already fetched by fetch_existing_env_names().
+    Returns False if any variable failed to upload.
+    """
+    print("🔄 Syncing environment variables to Vercel...")
 
+    # Load variables specifically from the .env file
+    # dotenv_values loads vars from .env file directly (not os.environ)
+    env_vars = dotenv_values(".env")
+
+    # Forced uploads replace everything, so the existing names are not needed
+    if force:
+        existing = frozenset()
+        ENV_LS_CACHE_PATH.unlink(missing_ok=True)
+    elif existing is None:
+        existing = fetch_existing_env_names()
+
+    pending = []
     for key, value in env_vars.items():
         # Skip empty lines or comments if any slipped through
-        if not key or not value:
+        if not key or not value or key in DEPLOY_ONLY_ENV_VARS:
             continue
 
         # If not forcing, skip variables that already exist to preserve previous values
-        if not force and exists_on_vercel(key):
+        if not force and key in existing:
             print(f"   - Skipping {key} (already set on Vercel)")
             continue
 
-        print(f"   - Setting {key}...", end=" ", flush=True)
+        pending.append((key, value))
 
-        try:
-            if force:
-                # Remove existing variable first (ignore errors)
-                subprocess.run(f'vercel env rm {key} production -y', shell=True, capture_output=True)
-
-            cmd = f'vercel env add {key} production'
-            process = subprocess.run(
-                cmd,
-                input=str(value),
-                shell=True,
-                capture_output=True,
-                text=True
-            )
-
-            if process.returncode == 0:
-                print("✅")
-            else:
-                print(f"❌ Error: {process.stderr.strip()}")
+    all_ok = True
+    if pending:
+        token = os.getenv("VERCEL_TOKEN")
+        project_id, org_id = _vercel_project_ids() if token else (None, None)
 
-        except Exception as e:
-            print(f"❌ Exception: {e}")
+        if token and project_id:
+            # Upsert replaces existing values, so no per-key rm is needed when forcing
+            print(f"   (uploading {len(pending)} variables via the Vercel API)")
+            for key, ok, err in _upsert_via_api(pending, token, project_id, org_id):
+                _report(key, ok, err)
+                if not ok:
+                    all_ok = False
+        else:
+            workers = _deploy_concurrency()
+            # Encode each value once; the CLI reads it from stdin as bytes
+            encoded = [(key, value.encode("utf-8")) for key, value in pending]
+            with ThreadPoolExecutor(max_workers=min(workers, len(encoded))) as executor:
+                # Each worker reports its variable as soon as it finishes
+                results = executor.map(lambda item: _upload_one(item[0], item[1], force), encoded)
+                for key, ok, err in results:
+                    if not ok:
+                        all_ok = False
+
+        # The cached listing no longer matches Vercel; list again next run
+        ENV_LS_CACHE_PATH.unlink(missing_ok=True)
 
     print("✨ Environment variables processed.")
+    return all_ok
 
 def deploy():
     """Deploy to Vercel."""
     print("🚀 Deploying to Vercel...")
     try:
         # --prod triggers a production deployment
-        result = subprocess.run("vercel --prod", shell=True)
+        result = subprocess.run([VERCEL, "--prod"])
         if result.returncode == 0:
             print("✅ Deployment successful!")
         else:
@@ -199,24 +478,25 @@ def main():
     if not check_vercel_cli():
         sys.exit(1)
     
-    project_root = Path(__file__).parent.parent
-    pyproject_path = project_root / "pyproject.toml"
-    lock_path = project_root / "uv.lock"
-
-    if not pyproject_path.exists():
-        print(f"❌ pyproject.toml not found at {pyproject_path}. Aborting — uv requires a pyproject.toml.")
+    if not PYPROJECT_PATH.exists():
+        print(f"❌ pyproject.toml not found at {PYPROJECT_PATH}. Aborting — uv requires a pyproject.toml.")
         sys.exit(1)
 
     # Ensure lockfile if using uv installer flow
-    if lock_path.exists():
-        print(f"🔒 Found existing uv.lock at {lock_path} — proceeding with uv-only deployment flow.")
+    if LOCK_PATH.exists():
+        print(f"🔒 Found existing uv.lock at {LOCK_PATH} — proceeding with uv-only deployment flow.")
     else:
         # Try to generate uv.lock automatically (best-effort)
-        if not ensure_uv_lock(project_root, lock_path):
+        if not ensure_uv_lock(PROJECT_ROOT, LOCK_PATH):
             print("❌ No uv.lock found at repo root; uv-only deploys require a lockfile. Aborting.")
             sys.exit(1)
         
     # STEP 2: Sync Env Vars
+    # List the variables already on Vercel while the user answers the prompt,
+    # unless a fresh cached listing makes that unnecessary
+    existing = _load_env_ls_cache()
+    ls_process = _start_env_ls() if existing is None else None
+
     # Ask user whether to keep previous Vercel envs or upload new ones.
     try:
         answer = input("Use previous Vercel env values? (Y/n): ").strip().lower()
@@ -228,10 +508,18 @@ def main():
     force_upload = True if answer == "n" else False
     if force_upload:
         print("ℹ️  Will upload and replace environment variables on Vercel.")
+        # Forced uploads replace everything, so the listing is not needed
+        if ls_process:
+            ls_process.kill()
+            ls_process.wait()
     else:
         print("ℹ️  Keeping existing Vercel environment variables (skipping upload).")
+        if existing is None:
+            existing = fetch_existing_env_names(ls_process)
 
-    push_env_vars(force=force_upload)
+    if not push_env_vars(force=force_upload, existing=existing):
+        print("❌ Some environment variables failed to upload. Aborting deployment.")
+        sys.exit(1)
     
     # STEP 3: Deploy
     deploy()
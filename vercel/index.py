@@ -1,9 +1,23 @@
-from fastapi import FastAPI, HTTPException, Depends, Security
+from fastapi import FastAPI, HTTPException, Depends, Request, Security
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
 from fastapi.security import APIKeyHeader
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
+from starlette.middleware.gzip import GZipMiddleware
 from dotenv import load_dotenv
 import uvicorn
 import os
+import asyncio
+import logging
+import hashlib
+import hmac
+import threading
+import orjson
+from concurrent.futures import Future
+from contextlib import asynccontextmanager
+from cachetools import TTLCache
 from toon import encode as toon_encode
 from src.tradingview_mcp.tradingview_tools import (
     fetch_historical_data,
@@ -17,9 +31,11 @@ from src.tradingview_mcp.tradingview_tools import (
 from src.tradingview_mcp.validators import (
     ValidationError, 
     validate_symbol,
-    validate_exchange
+    validate_exchange,
+    validate_timeframe
 )
 from src.tradingview_mcp.config import settings
+from src.tradingview_mcp.utils import close_http_session
 from .models import (
     HistoricalDataRequest,
     NewsHeadlinesRequest,
@@ -27,307 +43,400 @@ from .models import (
     AllIndicatorsRequest,
     IdeasRequest,
     MindsRequest,
-    OptionChainGreeksRequest
+    OptionChainGreeksRequest,
+    DataResponse
 )
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Define header schemes
 admin_header_scheme = APIKeyHeader(name="X-Admin-Key", auto_error=False)
 client_header_scheme = APIKeyHeader(name="X-Client-Key", auto_error=False)
 
+def _key_matches(key: str, expected: str) -> bool:
+    """Constant-time key comparison; bytes so non-ASCII input can't raise."""
+    return bool(key) and hmac.compare_digest(key.encode(), expected.encode())
+
 async def verify_admin(key: str = Security(admin_header_scheme)):
     """Only allows access if X-Admin-Key matches .env"""
-    if key != settings.ADMIN_API_KEY:
+    if not _key_matches(key, settings.ADMIN_API_KEY):
         raise HTTPException(status_code=403, detail="Unauthorized: Invalid Admin Key")
     return key
 
 async def verify_client(key: str = Security(client_header_scheme)):
     """Only allows access if X-Client-Key matches .env"""
-    if key != settings.CLIENT_API_KEY:
+    if not _key_matches(key, settings.CLIENT_API_KEY):
         raise HTTPException(status_code=403, detail="Unauthorized: Invalid Client Key")
     return key
 
 
+def encode_response(obj, encoding: str = "toon") -> str:
+    """Encode a tool result for the `data` field: TOON by default, or JSON on request."""
+    if encoding == "json":
+        # Option chains group by int expiry keys, so allow non-str keys
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str).decode()
+    return toon_encode(obj)
+
+
+# Short-lived caches of encoded responses for endpoints that clients poll with
+# identical arguments. TTLCache is not thread-safe and sync endpoints run in
+# the threadpool, so every access goes through the lock.
+_response_caches = {
+    "historical-data": TTLCache(maxsize=512, ttl=60),
+    "all-indicators": TTLCache(maxsize=1024, ttl=5),
+    "option-chain-greeks": TTLCache(maxsize=256, ttl=2),  # fast-moving
+    "news-headlines": TTLCache(maxsize=1024, ttl=60),
+    "ideas": TTLCache(maxsize=512, ttl=300),
+    "minds": TTLCache(maxsize=512, ttl=120),
+}
+_response_cache_lock = threading.Lock()
+# Per-cache hit/miss counters, reported by /health
+_cache_stats = {name: {"hits": 0, "misses": 0} for name in _response_caches}
+
+
+def _cookie_fingerprint() -> str:
+    """Short hash of the active cookie, so cached data never outlives a session change."""
+    return hashlib.sha256(settings.TRADINGVIEW_COOKIE.encode()).hexdigest()[:16]
+
+
+def _cache_get(name: str, key: tuple):
+    with _response_cache_lock:
+        data = _response_caches[name].get(key)
+        _cache_stats[name]["hits" if data is not None else "misses"] += 1
+        return data
+
+
+def _cache_set(name: str, key: tuple, data: str):
+    with _response_cache_lock:
+        _response_caches[name][key] = data
+
+
+# Identical requests that arrive while the first one is still scraping wait
+# for its result instead of hitting TradingView again
+_inflight: dict = {}
+_inflight_lock = threading.Lock()
+
+
+def _single_flight(key: tuple, produce):
+    """Run produce() once per key at a time; concurrent callers share its result or error."""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+    if not leader:
+        return future.result()
+
+    try:
+        data = produce()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(data)
+        return data
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """App startup/shutdown hook."""
+    yield
+    # Release the pooled keep-alive connections to TradingView on shutdown
+    close_http_session()
+
+
+# Error handling shared by all data endpoints: bad input is a 400, anything
+# else that escapes a handler is a 500 with the error text in `detail`.
+# The 500 is raised from inside the route, not from an Exception handler,
+# so the response still passes through the CORS and GZip middleware.
+_ERROR_PREFIXES = {
+    "/news-headlines": "Failed to fetch news",
+    "/news-content": "Failed to fetch news content",
+}
+
+
+class _ErrorHandlingRoute(APIRoute):
+    """APIRoute that turns unexpected endpoint errors into HTTP 500 responses."""
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        prefix = _ERROR_PREFIXES.get(self.path, "Unexpected error")
+
+        async def route_handler(request: Request):
+            try:
+                return await handler(request)
+            except (HTTPException, RequestValidationError, ValidationError):
+                raise
+            except Exception as e:
+                logger.exception("Unhandled error in %s", self.path)
+                raise HTTPException(status_code=500, detail=f"{prefix}: {e}")
+
+        return route_handler
+
+
 vercel_backend_url = os.getenv("VERCEL_URL",None)
 if vercel_backend_url:
-    print(f"🌐 Vercel backend URL set to: {vercel_backend_url}")
+    logger.info("🌐 Vercel backend URL set to: %s", vercel_backend_url)
 app = FastAPI(
     title="TradingView HTTP API",
     description="REST API for TradingView data scraping tools",
     version="1.0.0",
-    servers=[{"url": vercel_backend_url}] if vercel_backend_url else None
+    servers=[{"url": vercel_backend_url}] if vercel_backend_url else None,
+    lifespan=lifespan,
 )
+app.router.route_class = _ErrorHandlingRoute
+
+# Browser origins allowed to call the API: the deployment itself plus any
+# extra comma-separated origins from CORS_ALLOW_ORIGINS
+_cors_origins = [origin.strip().rstrip("/") for origin in os.getenv("CORS_ALLOW_ORIGINS", "").split(",") if origin.strip()]
+if vercel_backend_url:
+    _cors_origins.append(vercel_backend_url.rstrip("/"))
 
-# Add CORS middleware to handle cross-origin requests from the Chrome extension
+# Add CORS middleware to handle cross-origin requests from the Chrome extension.
+# Extension IDs are 32 chars from a-p; auth travels in headers, not cookies.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins for Chrome extension
-    allow_credentials=True,
-    allow_methods=["*"],  # Allow all HTTP methods
-    allow_headers=["*"]   # Allow all headers including X-Admin-Key
+    allow_origins=_cors_origins,
+    allow_origin_regex=r"^chrome-extension://[a-p]{32}$",
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "X-Admin-Key", "X-Client-Key"],
 )
 
+# Compress larger bodies (long candle histories, full option chains); small
+# responses are sent as-is since gzip would not pay for itself
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+@app.exception_handler(ValidationError)
+async def validation_error_handler(request: Request, exc: ValidationError):
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+
+@app.exception_handler(RequestValidationError)
+async def request_validation_error_handler(request: Request, exc: RequestValidationError):
+    # Integer fields are range-checked by the request models' validators; keep
+    # answering those with the same 400 and plain-string detail the endpoints
+    # gave when they checked the values themselves. Other body errors stay 422.
+    for error in exc.errors():
+        if error.get("type") == "value_error":
+            return JSONResponse(status_code=400, content={"detail": str(error["ctx"]["error"])})
+    return await request_validation_exception_handler(request, exc)
+
 
 # API Endpoints
-# Each endpoint corresponds to an MCP tool, with the same logic and error handling
+# Each endpoint corresponds to an MCP tool, with the same logic and error handling.
+# Declaring response_model lets FastAPI serialize the body straight to JSON
+# bytes with Pydantic instead of going through jsonable_encoder.
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint - no authentication required"""
-    return {"status": "healthy", "service": "TradingView HTTP API"}
+    with _response_cache_lock:
+        cache = {name: dict(stats) for name, stats in _cache_stats.items()}
+    return {"status": "healthy", "service": "TradingView HTTP API", "cache": cache}
 
 
-@app.post("/historical-data", dependencies=[Depends(verify_client)])
-async def get_historical_data_endpoint(request: HistoricalDataRequest):
+@app.post("/historical-data", response_model=DataResponse, dependencies=[Depends(verify_client)])
+def get_historical_data_endpoint(request: HistoricalDataRequest):
     """
     Fetch historical OHLCV data with technical indicators from TradingView.
     Returns candles with timestamps in IST. Requires internet connection.
     """
-
-    try:
-        # Validate numb_price_candles parameter
-        try:
-            numb_price_candles = int(request.numb_price_candles) if isinstance(request.numb_price_candles, str) else request.numb_price_candles
-            if not (1 <= numb_price_candles <= 5000):
-                raise ValidationError(f"numb_price_candles must be between 1 and 5000, got {numb_price_candles}")
-        except ValueError:
-            raise ValidationError("numb_price_candles must be a valid integer")
-
-
+    # Indicator names are matched case-insensitively and order does not
+    # change the data, so ["rsi", "MACD"] and ["MACD", "RSI"] share an entry
+    indicators_key = tuple(sorted(name.upper() for name in request.indicators))
+    cache_key = (request.exchange.upper(), request.symbol, request.timeframe, request.numb_price_candles, indicators_key, request.encoding, _cookie_fingerprint())
+    cached = _cache_get("historical-data", cache_key)
+    if cached is not None:
+        return {"data": cached}
+
+    def produce():
         # Call the core function from tradingview_tools
         result = fetch_historical_data(
             exchange=request.exchange,
             symbol=request.symbol,
             timeframe=request.timeframe,
-            numb_price_candles=numb_price_candles,
+            numb_price_candles=request.numb_price_candles,
             indicators=request.indicators
         )
-        
-        # Encode result in TOON format for efficiency
-        toon_data = toon_encode(result)
-        return {"data": toon_data}
 
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
+        # Encode in the requested format (TOON by default)
+        data = encode_response(result, request.encoding)
+        if result.get('success'):
+            _cache_set("historical-data", cache_key, data)
+        return data
+
+    return {"data": _single_flight(("historical-data",) + cache_key, produce)}
 
 
-@app.post("/news-headlines", dependencies=[Depends(verify_client)])
-async def get_news_headlines_endpoint(request: NewsHeadlinesRequest):
+@app.post("/news-headlines", response_model=DataResponse, dependencies=[Depends(verify_client)])
+def get_news_headlines_endpoint(request: NewsHeadlinesRequest):
     """
     Scrape latest news headlines from TradingView for a specific symbol.
     Returns headlines with title, provider, and story paths for full content.
     """
-    try:
-        # Call the core function - pass cookie directly
-        headlines = fetch_news_headlines(
-            symbol=request.symbol,
-            exchange=request.exchange,
-            provider=request.provider,
-            area=request.area,
-        )
-
-        if not headlines:
-            return {"data": "headlines[0]:"}
-
-
-        # Encode in TOON format
-        toon_data = toon_encode({"headlines": headlines})
-        return {"data": toon_data}
-
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch news: {str(e)}")
-
-
-@app.post("/news-content", dependencies=[Depends(verify_client)])
-async def get_news_content_endpoint(request: NewsContentRequest):
+    cache_key = (request.symbol, request.exchange, request.provider, request.area, request.encoding, _cookie_fingerprint())
+    cached = _cache_get("news-headlines", cache_key)
+    if cached is not None:
+        return {"data": cached}
+
+    # Call the core function - pass cookie directly
+    headlines = fetch_news_headlines(
+        symbol=request.symbol,
+        exchange=request.exchange,
+        provider=request.provider,
+        area=request.area,
+    )
+
+    if not headlines and request.encoding == "toon":
+        return {"data": "headlines[0]:"}
+
+    # Encode in the requested format (TOON by default)
+    data = encode_response({"headlines": headlines or []}, request.encoding)
+    if headlines:
+        _cache_set("news-headlines", cache_key, data)
+    return {"data": data}
+
+
+@app.post("/news-content", response_model=DataResponse, dependencies=[Depends(verify_client)])
+def get_news_content_endpoint(request: NewsContentRequest):
     """
     Fetch full news article content using story paths from headlines.
     Returns article title and body text. May return partial results.
     """
-    try:
-        # Call the core function - pass cookie directly
-        articles = fetch_news_content(request.story_paths)
+    # Call the core function - pass cookie directly
+    articles = fetch_news_content(request.story_paths)
 
-        # Encode in TOON format
-        toon_data = toon_encode({"articles": articles})
-        return {"data": toon_data}
+    # Encode in the requested format (TOON by default)
+    return {"data": encode_response({"articles": articles}, request.encoding)}
 
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch news content: {str(e)}")
 
-
-@app.post("/all-indicators", dependencies=[Depends(verify_client)])
-async def get_all_indicators_endpoint(request: AllIndicatorsRequest):
+@app.post("/all-indicators", response_model=DataResponse, dependencies=[Depends(verify_client)])
+def get_all_indicators_endpoint(request: AllIndicatorsRequest):
     """
     Return current values for all available technical indicators for a symbol.
     Provides latest snapshot, not historical series. Requires TRADINGVIEW_COOKIE.
     """
-    try:
-        # Validate parameters using centralized validators
-        from src.tradingview_mcp.validators import validate_exchange, validate_timeframe, validate_symbol
-
+    # Validate parameters using centralized validators
+    exchange = validate_exchange(request.exchange)
+    symbol = validate_symbol(request.symbol)
+    timeframe = validate_timeframe(request.timeframe)
 
-        exchange = validate_exchange(request.exchange)
-        symbol = validate_symbol(request.symbol)
-        timeframe = validate_timeframe(request.timeframe)
 
+    cache_key = (exchange, symbol, timeframe, request.encoding, _cookie_fingerprint())
+    cached = _cache_get("all-indicators", cache_key)
+    if cached is not None:
+        return {"data": cached}
 
-        # Call the core function
-        result = fetch_all_indicators(exchange=exchange, symbol=symbol, timeframe=timeframe)
+    # Call the core function
+    result = fetch_all_indicators(exchange=exchange, symbol=symbol, timeframe=timeframe)
 
 
-        # Encode in TOON format
-        toon_data = toon_encode(result)
-        return {"data": toon_data}
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
+    # Encode in the requested format (TOON by default)
+    data = encode_response(result, request.encoding)
+    # Only successful results are cached; failures are retried next call
+    if result.get('success'):
+        _cache_set("all-indicators", cache_key, data)
+    return {"data": data}
 
 
-@app.post("/ideas", dependencies=[Depends(verify_client)])
-async def get_ideas_endpoint(request: IdeasRequest):
+@app.post("/ideas", response_model=DataResponse, dependencies=[Depends(verify_client)])
+def get_ideas_endpoint(request: IdeasRequest):
     """
     Scrape trading ideas from TradingView for a specific symbol.
     Returns ideas with title, author, and content. Supports pagination and sorting.
     """
-    try:
-        # Validate startPage
-        try:
-            startPage = int(request.startPage) if isinstance(request.startPage, str) else request.startPage
-            if not (1 <= startPage <= 10):
-                raise ValidationError(f"startPage must be between 1 and 10, got {startPage}")
-        except ValueError:
-            raise ValidationError("startPage must be a valid integer")
-
-        # Validate endPage
-        try:
-            endPage = int(request.endPage) if isinstance(request.endPage, str) else request.endPage
-            if not (1 <= endPage <= 10):
-                raise ValidationError(f"endPage must be between 1 and 10, got {endPage}")
-            if endPage < startPage:
-                raise ValidationError(f"endPage ({endPage}) must be greater than or equal to startPage ({startPage})")
-        except ValueError:
-            raise ValidationError("endPage must be a valid integer")
-
-        # Validate symbol
-        symbol = validate_symbol(request.symbol)
-
-        # Call the core function - pass cookie directly
-        result = fetch_ideas(
-            symbol=symbol,
-            startPage=startPage,
-            endPage=endPage,
-            sort=request.sort,
-        )
-
-        # Encode in TOON format
-        toon_data = toon_encode(result)
-        return {"data": toon_data}
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
-
-
-@app.post("/minds", dependencies=[Depends(verify_client)])
-async def get_minds_endpoint(request: MindsRequest):
+    # Validate symbol
+    symbol = validate_symbol(request.symbol)
+
+    cache_key = (symbol, request.startPage, request.endPage, request.sort, request.encoding, _cookie_fingerprint())
+    cached = _cache_get("ideas", cache_key)
+    if cached is not None:
+        return {"data": cached}
+
+    # Call the core function - pass cookie directly
+    result = fetch_ideas(
+        symbol=symbol,
+        startPage=request.startPage,
+        endPage=request.endPage,
+        sort=request.sort,
+    )
+
+    # Encode in the requested format (TOON by default)
+    data = encode_response(result, request.encoding)
+    if result.get('success'):
+        _cache_set("ideas", cache_key, data)
+    return {"data": data}
+
+
+@app.post("/minds", response_model=DataResponse, dependencies=[Depends(verify_client)])
+def get_minds_endpoint(request: MindsRequest):
     """
     Get community discussions (Minds) from TradingView for a specific symbol.
     Returns structured discussion data with author, text, likes, and comments.
     """
-    try:
-        limit = None
-        if request.limit is not None:
-            try:
-                limit = int(request.limit) if isinstance(request.limit, str) else request.limit
-                if limit <= 0:
-                    raise ValidationError(f"limit must be a positive integer, got {limit}")
-            except ValueError:
-                raise ValidationError("limit must be a valid integer")
+    symbol = validate_symbol(request.symbol)
+    exchange = validate_exchange(request.exchange)
 
-        symbol = validate_symbol(request.symbol)
-        exchange = validate_exchange(request.exchange)
+    cache_key = (symbol, exchange, request.limit, request.encoding, _cookie_fingerprint())
+    cached = _cache_get("minds", cache_key)
+    if cached is not None:
+        return {"data": cached}
 
-        result = fetch_minds(
-            symbol=symbol,
-            exchange=exchange,
-            limit=limit,
-        )
+    result = fetch_minds(
+        symbol=symbol,
+        exchange=exchange,
+        limit=request.limit,
+    )
 
-        toon_data = toon_encode(result)
-        return {"data": toon_data}
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
+    data = encode_response(result, request.encoding)
+    if result.get('success'):
+        _cache_set("minds", cache_key, data)
+    return {"data": data}
 
 
-@app.post("/option-chain-greeks", dependencies=[Depends(verify_client)])
-async def get_option_chain_greeks_endpoint(request: OptionChainGreeksRequest):
+@app.post("/option-chain-greeks", response_model=DataResponse, dependencies=[Depends(verify_client)])
+def get_option_chain_greeks_endpoint(request: OptionChainGreeksRequest):
     """
     Fetches real-time option chain with full Greeks, IV, and analytics.
     Returns strikes with bid/ask, theo prices, delta/gamma/theta/vega/rho, and IV data.
     """
-    try:
-        # Validate no_of_ITM
-        try:
-            no_of_ITM = int(request.no_of_ITM) if isinstance(request.no_of_ITM, str) else request.no_of_ITM
-            if not (1 <= no_of_ITM <= 20):
-                raise ValidationError(f"no_of_ITM must be between 1 and 20, got {no_of_ITM}")
-        except ValueError:
-            raise ValidationError("no_of_ITM must be a valid integer")
-        
-        # Validate no_of_OTM
-        try:
-            no_of_OTM = int(request.no_of_OTM) if isinstance(request.no_of_OTM, str) else request.no_of_OTM
-            if not (1 <= no_of_OTM <= 20):
-                raise ValidationError(f"no_of_OTM must be between 1 and 20, got {no_of_OTM}")
-        except ValueError:
-            raise ValidationError("no_of_OTM must be a valid integer")
-
-
-        # Validate parameters
-        from src.tradingview_mcp.validators import validate_exchange, validate_symbol
+    # Validate parameters
+    exchange = validate_exchange(request.exchange)
+    symbol = validate_symbol(request.symbol)
 
-        exchange = validate_exchange(request.exchange)
-        symbol = validate_symbol(request.symbol)
+    cache_key = (exchange, symbol, str(request.expiry_date), request.no_of_ITM, request.no_of_OTM, request.encoding, _cookie_fingerprint())
+    cached = _cache_get("option-chain-greeks", cache_key)
+    if cached is not None:
+        return {"data": cached}
 
+    def produce():
         # Call the core function
         result = process_option_chain_with_analysis(
             symbol=symbol,
             exchange=exchange,
             expiry_date=request.expiry_date,
-            no_of_ITM=no_of_ITM,
-            no_of_OTM=no_of_OTM,
+            no_of_ITM=request.no_of_ITM,
+            no_of_OTM=request.no_of_OTM,
         )
 
-        # Encode in TOON format
-        toon_data = toon_encode(result)
-        return {"data": toon_data}
-
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
+        # Encode in the requested format (TOON by default)
+        data = encode_response(result, request.encoding)
+        if result.get('success'):
+            _cache_set("option-chain-greeks", cache_key, data)
+        return data
 
+    return {"data": _single_flight(("option-chain-greeks",) + cache_key, produce)}
 
-@app.get("/privacy-policy", include_in_schema=False)
-async def get_privacy_policy():
-    """
-    Privacy Policy endpoint.
 
-    Returns the privacy policy and disclaimer for the API.
-    """
-    return {
-        "privacy_policy": """
+# Privacy policy JSON body, serialized once at import
+_PRIVACY_POLICY_BODY = orjson.dumps({
+    "privacy_policy": """
         Privacy Policy for TradingView HTTP API Server
 
         This application and its associated API are created solely for learning and improving purposes. All data, tools, and information provided through this service are intended for educational use only.
@@ -345,7 +454,36 @@ async def get_privacy_policy():
 
         For any questions or concerns, please contact the repository owner.
         """
-    }
+})
+
+
+@app.get("/privacy-policy", include_in_schema=False)
+async def get_privacy_policy():
+    """
+    Privacy Policy endpoint.
+
+    Returns the privacy policy and disclaimer for the API.
+    """
+    return Response(_PRIVACY_POLICY_BODY, media_type="application/json")
+
+
+# Static API info for "/", serialized once; VERCEL_URL is fixed for the life of the process
+_ROOT_INFO_BODY = orjson.dumps({
+    "message": "TradingView HTTP API Server",
+    "version": "1.0.0",
+    "servers": [
+        {"url": vercel_backend_url or "https://tradingview-mcp.vercel.app/"}
+    ],
+    "endpoints": [
+        "/historical-data",
+        "/news-headlines",
+        "/news-content",
+        "/all-indicators",
+        "/ideas",
+        "/option-chain-greeks",
+        "/privacy-policy"
+    ]
+})
 
 
 @app.get("/", include_in_schema=False)
@@ -355,22 +493,7 @@ async def root():
     
     Returns basic info about available endpoints.
     """
-    return {
-        "message": "TradingView HTTP API Server",
-        "version": "1.0.0",
-        "servers":[
-            {"url": os.getenv("VERCEL_URL", "https://tradingview-mcp.vercel.app/")}
-        ],
-        "endpoints": [
-            "/historical-data",
-            "/news-headlines", 
-            "/news-content",
-            "/all-indicators",
-            "/ideas",
-            "/option-chain-greeks",
-            "/privacy-policy"
-        ]
-    }
+    return Response(_ROOT_INFO_BODY, media_type="application/json")
 
 @app.post("/update-cookies", include_in_schema=False, dependencies=[Depends(verify_admin)])
 async def update_cookies(request: dict):
@@ -384,7 +507,7 @@ async def update_cookies(request: dict):
         if not raw_cookies:
             return {"success": False, "message": "No cookies provided in payload"}
 
-        print(f"📥 Received {len(raw_cookies)} cookies from {source}")
+        logger.info("📥 Received %d cookies from %s", len(raw_cookies), source)
 
         # 1. CONSTRUCT COOKIE STRING
         # We accept all cookies provided by the extension to ensure we have the full session
@@ -397,20 +520,21 @@ async def update_cookies(request: dict):
                 cookie_parts.append(f"{name}={value}")
         
         new_cookie_string = "; ".join(cookie_parts)
-        print("🕵️ Verifying new session...")
+        logger.info("🕵️ Verifying new session...")
         
         
         try:
             # Attempt to fetch a simple data point (like ideas or indicators)
-            # This triggers the JWT extraction and HTTP request using the new cookie
-            test_result = fetch_ideas("BTCUSD", startPage=1, endPage=1, cookie=new_cookie_string)
+            # This triggers the JWT extraction and HTTP request using the new cookie.
+            # The scrape is blocking, so run it off the event loop.
+            test_result = await asyncio.to_thread(fetch_ideas, "BTCUSD", startPage=1, endPage=1, cookie=new_cookie_string)
             
             # Check if the result indicates a success (fetched data)
             # If the cookie is bad, fetch_ideas typically returns empty or raises an error in auth
             if isinstance(test_result, dict) and test_result.get('success') is False:
                  raise ValueError("Validation request returned failure.")
             
-            print("✅ Cookie Verification Successful!")
+            logger.info("✅ Cookie Verification Successful!")
             # Update the server's cookie setting
             settings.update_cookie(new_cookie_string)
             return {
@@ -420,7 +544,7 @@ async def update_cookies(request: dict):
             }
 
         except Exception as e:
-            print(f"❌ Verification Failed: {str(e)}")
+            logger.warning("❌ Verification Failed: %s", e)
             return {
                 "success": False, 
                 "message": f"Cookie validation failed: {str(e)}. Reverted to previous session."
@@ -430,6 +554,12 @@ async def update_cookies(request: dict):
         return {"success": False, "message": f"Server error processing cookies: {str(e)}"}
 
 
+# Build the OpenAPI schema (with its long generated field descriptions) once
+# at import; FastAPI then serves the cached app.openapi_schema for /docs and
+# /openapi.json instead of generating it on the first request
+app.openapi()
+
+
 def main():
     """
     Main function to run the HTTP server.
@@ -437,6 +567,9 @@ def main():
     Starts the uvicorn server on host 0.0.0.0 and port 4589.
     This allows remote access to the API.
     """
+    # Request-path messages go through `logging`; show INFO when run locally
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print("🚀 Starting TradingView HTTP API Server...")
     print("📊 Available endpoints:")
     print("   - POST /historical-data: Fetch OHLCV data with indicators")
@@ -451,8 +584,20 @@ def main():
     print("📖 API docs available at http://localhost:4589/docs")
     print("\n⚡ Server is ready!")
     
-    # Run the server
-    uvicorn.run(app, host="0.0.0.0", port=4589)
+    # Run the server. uvicorn picks uvloop/httptools automatically when the
+    # [standard] extras are installed. Extra worker processes need an import
+    # string, and each keeps its own cookie and response caches, so
+    # /update-cookies only reaches the worker that served it.
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    uvicorn.run(
+        "vercel.index:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=4589,
+        workers=workers,
+        # One log line per request is pure overhead under load; set
+        # ACCESS_LOG=1 to turn it back on when debugging
+        access_log=os.getenv("ACCESS_LOG", "0") == "1",
+    )
 
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ These models define the request/response schemas for all API endpoints.
 import sys
 import os
 from typing import List, Optional, Literal, Union
-from pydantic import Field, BaseModel
+from pydantic import ConfigDict, Field, BaseModel, field_validator, model_validator
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -16,48 +16,101 @@ from src.tradingview_mcp.validators import (
     VALID_AREAS, INDICATOR_MAPPING
 )
 
-
-class HistoricalDataRequest(BaseModel):
-    exchange: str = Field(..., min_length=2, max_length=30, description=f"Stock exchange name (e.g., 'NSE', 'NASDAQ', 'BINANCE'). Must be one of the valid exchanges like {', '.join(VALID_EXCHANGES[:5])}... Use uppercase format.")
+# Option lists shared by several field descriptions, joined once
+_EXCHANGES_PREVIEW = ', '.join(VALID_EXCHANGES[:5])
+_EXCHANGES_STR = ', '.join(VALID_EXCHANGES)
+_NEWS_PROVIDERS_STR = ', '.join(VALID_NEWS_PROVIDERS)
+_INDICATORS_STR = ', '.join(INDICATOR_MAPPING.keys())
+_TIMEFRAMES_STR = ', '.join(VALID_TIMEFRAMES)
+
+
+def _int_in_range(field: str, lo: int, hi: Optional[int] = None):
+    """Build a before-validator that accepts an int or numeric str for `field` and range-checks it."""
+    def check(cls, value):
+        if value is None:
+            return value
+        # int() would silently turn True into 1 and truncate 10.7 to 10
+        if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+            raise ValueError(f"{field} must be a valid integer")
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{field} must be a valid integer")
+        if hi is None and value < lo:
+            raise ValueError(f"{field} must be a positive integer, got {value}")
+        if hi is not None and not lo <= value <= hi:
+            raise ValueError(f"{field} must be between {lo} and {hi}, got {value}")
+        return value
+    return field_validator(field, mode="before")(check)
+
+
+class BaseRequest(BaseModel):
+    # Requests are read-only once parsed; strip stray whitespace from symbols etc.
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
+    encoding: Literal['toon', 'json'] = Field('toon', description="Encoding of the returned 'data' string. 'toon' (default) is compact for LLMs; 'json' is faster to produce and parse.")
+
+
+class HistoricalDataRequest(BaseRequest):
+    exchange: str = Field(..., min_length=2, max_length=30, description=f"Stock exchange name (e.g., 'NSE', 'NASDAQ', 'BINANCE'). Must be one of the valid exchanges like {_EXCHANGES_PREVIEW}... Use uppercase format.")
     symbol: str = Field(..., min_length=1, max_length=20, description="Trading symbol/ticker (e.g., 'NIFTY', 'AAPL', 'BTCUSD'). Search online for correct symbol format for your exchange.")
     timeframe: Literal['1m', '5m', '15m', '30m', '1h', '2h', '4h', '1d', '1w', '1M'] = Field(..., description="Time interval for each candle. Options: 1m (1 minute), 5m, 15m, 30m, 1h (1 hour), 2h, 4h, 1d (1 day), 1w (1 week), 1M (1 month)")
-    numb_price_candles: Union[int, str] = Field(..., description="Number of historical candles to fetch (1-5000). Accepts int or str (e.g., 100 or '100'). More candles = longer history. E.g., 100 for last 100 periods.")
-    indicators: List[str] = Field(default=[], description=f"List of technical indicators to include. Options: {', '.join(INDICATOR_MAPPING.keys())}. Example: ['RSI', 'MACD', 'CCI', 'BB']. Leave empty for no indicators.")
+    numb_price_candles: int = Field(..., description="Number of historical candles to fetch (1-5000). Accepts int or str (e.g., 100 or '100'). More candles = longer history. E.g., 100 for last 100 periods.")
+    indicators: List[str] = Field(default=[], description=f"List of technical indicators to include. Options: {_INDICATORS_STR}. Example: ['RSI', 'MACD', 'CCI', 'BB']. Leave empty for no indicators.")
+
+    _check_candles = _int_in_range("numb_price_candles", 1, 5000)
 
 
-class NewsHeadlinesRequest(BaseModel):
+class NewsHeadlinesRequest(BaseRequest):
     symbol: str = Field(..., min_length=1, max_length=20, description="Trading symbol for news (e.g., 'NIFTY', 'AAPL', 'BTC'). Required. Search online for correct symbol.")
-    exchange: Optional[str] = Field(None, min_length=2, max_length=30, description=f"Optional exchange filter. One of: {', '.join(VALID_EXCHANGES)}... Leave empty for all exchanges.")
-    provider: str = Field("all", min_length=3, max_length=20, description=f"News provider filter. Options: {', '.join(VALID_NEWS_PROVIDERS)}... or 'all' for all providers.")
+    exchange: Optional[str] = Field(None, min_length=2, max_length=30, description=f"Optional exchange filter. One of: {_EXCHANGES_STR}... Leave empty for all exchanges.")
+    provider: str = Field("all", min_length=3, max_length=20, description=f"News provider filter. Options: {_NEWS_PROVIDERS_STR}... or 'all' for all providers.")
     area: Literal['world', 'americas', 'europe', 'asia', 'oceania', 'africa'] = Field('asia', description="Geographical area filter for news. Default is 'asia'.")
 
 
-class NewsContentRequest(BaseModel):
+class NewsContentRequest(BaseRequest):
     story_paths: List[str] = Field(..., min_length=1, max_length=20, description="List of story paths from news headlines. Each path must start with '/news/'. Get these from get_news_headlines() results.")
 
 
-class AllIndicatorsRequest(BaseModel):
+class AllIndicatorsRequest(BaseRequest):
     symbol: str = Field(..., min_length=1, max_length=20, description="Trading symbol/ticker (e.g., 'NIFTY', 'AAPL', 'BTCUSD'). Required.")
-    exchange: str = Field(..., min_length=2, max_length=30, description=f"Stock exchange name (e.g., 'NSE'). Must be one of the valid exchanges. Valid examples: {', '.join(VALID_EXCHANGES[:5])}... Use uppercase format.")
-    timeframe: Literal['1m', '5m', '15m', '30m', '1h', '2h', '4h', '1d', '1w', '1M'] = Field('1m', description=f"Time interval for indicator snapshot. Valid options: {', '.join(VALID_TIMEFRAMES)}")
+    exchange: str = Field(..., min_length=2, max_length=30, description=f"Stock exchange name (e.g., 'NSE'). Must be one of the valid exchanges. Valid examples: {_EXCHANGES_PREVIEW}... Use uppercase format.")
+    timeframe: Literal['1m', '5m', '15m', '30m', '1h', '2h', '4h', '1d', '1w', '1M'] = Field('1m', description=f"Time interval for indicator snapshot. Valid options: {_TIMEFRAMES_STR}")
 
 
-class IdeasRequest(BaseModel):
+class IdeasRequest(BaseRequest):
     symbol: str = Field(..., min_length=1, max_length=20, description="Trading symbol/ticker (e.g., 'NIFTY', 'AAPL', 'BTCUSD'). Search online for correct symbol format for your exchange.")
-    startPage: Union[int, str] = Field(1, description="Starting page number for scraping ideas. Accepts int or str (e.g., 1 or '1').")
-    endPage: Union[int, str] = Field(1, description="Ending page number for scraping ideas. Accepts int or str (e.g., 1 or '1').")
+    startPage: int = Field(1, description="Starting page number for scraping ideas. Accepts int or str (e.g., 1 or '1').")
+    endPage: int = Field(1, description="Ending page number for scraping ideas. Accepts int or str (e.g., 1 or '1').")
     sort: Literal['popular', 'recent'] = Field('popular', description="Sorting order for ideas. 'popular' for most liked, 'recent' for latest.")
 
+    _check_start_page = _int_in_range("startPage", 1, 10)
+    _check_end_page = _int_in_range("endPage", 1, 10)
+
+    @model_validator(mode="after")
+    def _check_page_order(self):
+        if self.endPage < self.startPage:
+            raise ValueError(f"endPage ({self.endPage}) must be greater than or equal to startPage ({self.startPage})")
+        return self
+
 
-class MindsRequest(BaseModel):
+class MindsRequest(BaseRequest):
     symbol: str = Field(..., min_length=1, max_length=20, description="Trading symbol/ticker (e.g., 'NIFTY', 'AAPL', 'BTCUSD'). Required.")
-    exchange: str = Field(..., min_length=2, max_length=30, description=f"Stock exchange name (e.g., 'NSE'). Must be one of the valid exchanges. Valid examples: {', '.join(VALID_EXCHANGES[:5])}... Use uppercase format.")
-    limit: Optional[Union[int, str]] = Field(None, description="Maximum number of discussions to retrieve from first page. If None, fetches all available. Accepts int or str (e.g., 100 or '100').")
+    exchange: str = Field(..., min_length=2, max_length=30, description=f"Stock exchange name (e.g., 'NSE'). Must be one of the valid exchanges. Valid examples: {_EXCHANGES_PREVIEW}... Use uppercase format.")
+    limit: Optional[int] = Field(None, description="Maximum number of discussions to retrieve from first page. If None, fetches all available. Accepts int or str (e.g., 100 or '100').")
 
+    _check_limit = _int_in_range("limit", 1)
 
-class OptionChainGreeksRequest(BaseModel):
+
+class OptionChainGreeksRequest(BaseRequest):
     symbol: str = Field(..., min_length=1, max_length=20, description="Underlying symbol (e.g., 'NIFTY', 'BANKNIFTY'). Required.")
-    exchange: str = Field(..., min_length=2, max_length=30, description=f"Stock exchange name (e.g., 'NSE'). Must be one of the valid exchanges. Valid examples: {', '.join(VALID_EXCHANGES[:5])}... Use uppercase format.")
+    exchange: str = Field(..., min_length=2, max_length=30, description=f"Stock exchange name (e.g., 'NSE'). Must be one of the valid exchanges. Valid examples: {_EXCHANGES_PREVIEW}... Use uppercase format.")
     expiry_date: Optional[Union[int, str]] = Field('nearest', description="Option expiry date:\n- 'nearest' (default): NEAREST expiry only\n- 'all': ALL expiries grouped by date\n- int YYYYMMDD (e.g., 20251202): SPECIFIC expiry")
-    no_of_ITM: Union[int, str] = Field(5, description="Number of In-The-Money strikes. Default 5, max 20.")
-    no_of_OTM: Union[int, str] = Field(5, description="Number of Out-of-The-Money strikes. Default 5, max 20.")
\ No newline at end of file
+    no_of_ITM: int = Field(5, description="Number of In-The-Money strikes. Default 5, max 20. Accepts int or str.")
+    no_of_OTM: int = Field(5, description="Number of Out-of-The-Money strikes. Default 5, max 20. Accepts int or str.")
+
+    _check_itm = _int_in_range("no_of_ITM", 1, 20)
+    _check_otm = _int_in_range("no_of_OTM", 1, 20)
+
+class DataResponse(BaseModel):
+    data: str = Field(..., description="Tool result encoded as TOON or JSON, per the request's 'encoding'.")